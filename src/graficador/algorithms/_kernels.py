@@ -0,0 +1,213 @@
+"""
+Rasterization kernels module.
+
+Tight integer loops used by the algorithm modules. Each kernel writes pixel
+coordinates into preallocated int32 buffers and returns how many it wrote.
+When Numba is installed (optional `fast` extra) the kernels are compiled to
+native code that releases the GIL, so several primitives can be rasterized
+from worker threads at once; otherwise the same functions run as plain Python.
+
+Every kernel is declared with an explicit signature, so Numba compiles it
+(or loads it from the on-disk cache) when this module is imported instead
+of on the first drawing call. Coordinates are int64 scalars and arrays; the
+output buffers are int32.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for `numba.njit` when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+@njit("int64(int64, int64, int64, int64, int32[:], int32[:])", cache=True, nogil=True)
+def dda_line_into(x1: int, y1: int, x2: int, y2: int,
+                  xs: np.ndarray, ys: np.ndarray) -> int:
+    """
+    Rasterize a line with the DDA algorithm into coordinate buffers.
+
+    Position i is computed directly as p1 + i * increment and rounded half
+    to even, exactly like the NumPy formulation, so long lines do not drift.
+
+    Args:
+        x1, y1: Starting point of the line.
+        x2, y2: End point of the line.
+        xs: int32 buffer receiving X coordinates. Must hold at least
+            max(|x2 - x1|, |y2 - y1|) + 1 entries.
+        ys: int32 buffer receiving Y coordinates, same size as xs.
+
+    Returns:
+        Number of pixels written.
+    """
+    dx = x2 - x1
+    dy = y2 - y1
+    steps = max(abs(dx), abs(dy))
+    if steps == 0:
+        xs[0] = x1
+        ys[0] = y1
+        return 1
+
+    x_inc = dx / steps
+    y_inc = dy / steps
+    for i in range(steps + 1):
+        xs[i] = np.rint(x1 + i * x_inc)
+        ys[i] = np.rint(y1 + i * y_inc)
+    return steps + 1
+
+@njit("int64(int64, int64, int64, int64, int32[:], int32[:])", cache=True, nogil=True)
+def bresenham_line_into(x1: int, y1: int, x2: int, y2: int,
+                        xs: np.ndarray, ys: np.ndarray) -> int:
+    """
+    Rasterize a line with Bresenham's algorithm into coordinate buffers.
+
+    Args:
+        x1, y1: Starting point of the line.
+        x2, y2: End point of the line.
+        xs: int32 buffer receiving X coordinates. Must hold at least
+            max(|x2 - x1|, |y2 - y1|) + 1 entries.
+        ys: int32 buffer receiving Y coordinates, same size as xs.
+
+    Returns:
+        Number of pixels written.
+    """
+    dx = abs(x2 - x1)
+    dy = abs(y2 - y1)
+    sx = 1 if x1 < x2 else -1
+    sy = 1 if y1 < y2 else -1
+    err = dx - dy
+
+    x, y = x1, y1
+    k = 0
+    while True:
+        xs[k] = x
+        ys[k] = y
+        k += 1
+
+        if x == x2 and y == y2:
+            break
+
+        # Step masks instead of branches: both tests use the same e2, so the
+        # updates can be applied unconditionally, scaled by 0 or 1.
+        e2 = 2 * err
+        step_x = int(e2 > -dy)
+        step_y = int(e2 < dx)
+        err += dx * step_y - dy * step_x
+        x += sx * step_x
+        y += sy * step_y
+    return k
+
+@njit("void(int64[:], int64[:], int64[:], int64[:], int64[:], int32[:], int32[:])",
+      cache=True, nogil=True, parallel=True)
+def bresenham_lines_into(x1s: np.ndarray, y1s: np.ndarray, x2s: np.ndarray, y2s: np.ndarray,
+                         offsets: np.ndarray, xs: np.ndarray, ys: np.ndarray) -> None:
+    """
+    Rasterize a batch of lines with Bresenham's algorithm into shared buffers.
+
+    Line i is written to xs[offsets[i]:offsets[i + 1]] (and likewise ys),
+    so the lines are independent and run in parallel when compiled.
+
+    Args:
+        x1s, y1s: Starting points of the lines.
+        x2s, y2s: End points of the lines.
+        offsets: Start index of each line in the buffers, followed by the
+            total size; line i needs max(|x2 - x1|, |y2 - y1|) + 1 entries.
+        xs: int32 buffer receiving X coordinates.
+        ys: int32 buffer receiving Y coordinates, same size as xs.
+    """
+    for i in prange(len(x1s)):
+        start = offsets[i]
+        end = offsets[i + 1]
+        bresenham_line_into(x1s[i], y1s[i], x2s[i], y2s[i], xs[start:end], ys[start:end])
+
+@njit("int64(int64, int64, int64, int64, int32[:], int32[:], int64)", cache=True, nogil=True)
+def _put_symmetric4(xc: int, yc: int, x: int, y: int,
+                    xs: np.ndarray, ys: np.ndarray, k: int) -> int:
+    """
+    Write the four-way reflections of a first-quadrant offset.
+
+    Offsets on an axis are their own mirror images and are written once.
+
+    Args:
+        xc, yc: Center of the reflection.
+        x, y: Non-negative offset from the center.
+        xs: int32 buffer receiving X coordinates.
+        ys: int32 buffer receiving Y coordinates, same size as xs.
+        k: Index of the first free entry in the buffers.
+
+    Returns:
+        Index of the first free entry after the written points.
+    """
+    xs[k] = xc + x
+    ys[k] = yc + y
+    k += 1
+    if x > 0:
+        xs[k] = xc - x
+        ys[k] = yc + y
+        k += 1
+    if y > 0:
+        xs[k] = xc + x
+        ys[k] = yc - y
+        k += 1
+        if x > 0:
+            xs[k] = xc - x
+            ys[k] = yc - y
+            k += 1
+    return k
+
+@njit("int64(int64, int64, int64, int64, int32[:], int32[:])", cache=True, nogil=True)
+def ellipse_into(xc: int, yc: int, rx: int, ry: int,
+                 xs: np.ndarray, ys: np.ndarray) -> int:
+    """
+    Rasterize an ellipse with the midpoint algorithm into coordinate buffers.
+
+    The decision parameters are scaled by 4 so the whole recurrence stays in
+    integer arithmetic; the signs tested at each step are unchanged. Each
+    first-quadrant point is written with its reflections as it is found.
+
+    Args:
+        xc, yc: Center of the ellipse.
+        rx: Horizontal radius. Must be positive.
+        ry: Vertical radius. Must be positive.
+        xs: int32 buffer receiving X coordinates. Must hold at least
+            4 * (rx + ry + 1) entries.
+        ys: int32 buffer receiving Y coordinates, same size as xs.
+
+    Returns:
+        Number of pixels written.
+    """
+    rx_sq = rx * rx
+    ry_sq = ry * ry
+
+    x = 0
+    y = ry
+    p1 = 4 * ry_sq - 4 * rx_sq * ry + rx_sq
+
+    k = _put_symmetric4(xc, yc, x, y, xs, ys, 0)
+
+    while ry_sq * x < rx_sq * y:
+        x += 1
+        if p1 < 0:
+            p1 += 4 * (2 * ry_sq * x + ry_sq)
+        else:
+            y -= 1
+            p1 += 4 * (2 * ry_sq * x - 2 * rx_sq * y + ry_sq)
+        k = _put_symmetric4(xc, yc, x, y, xs, ys, k)
+
+    p2 = ry_sq * (2 * x + 1) * (2 * x + 1) + 4 * rx_sq * (y - 1) * (y - 1) - 4 * rx_sq * ry_sq
+
+    while y > 0:
+        y -= 1
+        if p2 > 0:
+            p2 += 4 * (rx_sq - 2 * rx_sq * y)
+        else:
+            x += 1
+            p2 += 4 * (2 * ry_sq * x - 2 * rx_sq * y + rx_sq)
+        k = _put_symmetric4(xc, yc, x, y, xs, ys, k)
+    return k
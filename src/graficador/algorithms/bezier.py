@@ -9,22 +9,154 @@ using Pygame. It provides two different implementations:
 Bezier curves are useful for creating smooth and controllable shapes, widely
 used in graphic design and geometric modeling.
 """
-from typing import Callable, List
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
 import pygame
 from ..geometry.point import Point
+from .plotting import PixelPlotter, plot_pixels
 
-PixelPlotter = Callable[[int, int, pygame.Color], None]
 LineDrawer = Callable[[Point, Point, pygame.Color], None]
+Vec2 = Tuple[float, float]
+
+# Subdivision depth limit for adaptive flattening (at most 2**16 segments).
+MAX_SUBDIVISION_DEPTH: int = 16
+
+# Bernstein basis matrices of shape (num_segments + 1, 4), keyed by num_segments.
+_BEZIER_BASIS: Dict[int, np.ndarray] = {}
+
+def _bezier_basis(num_segments: int) -> np.ndarray:
+    """
+    Get the cubic Bernstein basis evaluated at evenly spaced parameters.
+
+    Row i holds the weights of the four control points at t = i / num_segments.
+    The matrix only depends on the segment count, so it is built once per count
+    and cached.
+
+    Args:
+        num_segments: Number of equal steps between t = 0 and t = 1.
+
+    Returns:
+        Read-only float64 array of shape (num_segments + 1, 4).
+    """
+    basis = _BEZIER_BASIS.get(num_segments)
+    if basis is None:
+        t = np.linspace(0.0, 1.0, num_segments + 1)
+        mt = 1.0 - t
+        basis = np.stack((mt * mt * mt, 3.0 * mt * mt * t, 3.0 * mt * t * t, t * t * t), axis=1)
+        basis.flags.writeable = False
+        _BEZIER_BASIS[num_segments] = basis
+    return basis
+
+def _sample_cubic(p0: Point, p1: Point, p2: Point, p3: Point,
+                  num_segments: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sample a cubic Bezier at evenly spaced parameters.
+
+    All samples are computed at once as the product of the cached basis
+    matrix with the (4, 2) matrix of control points.
+
+    Args:
+        p0: Starting point of the curve.
+        p1: First control point.
+        p2: Second control point.
+        p3: End point of the curve.
+        num_segments: Number of intervals; num_segments + 1 samples are returned.
+
+    Returns:
+        Tuple (xs, ys) of int32 arrays with the rounded sample coordinates.
+    """
+    control = np.array((p0, p1, p2, p3), dtype=np.float64)
+    samples = np.rint(_bezier_basis(num_segments) @ control).astype(np.int32)
+    return samples[:, 0], samples[:, 1]
+
+def _flatten(p0: Vec2, p1: Vec2, p2: Vec2, p3: Vec2,
+             tolerance: float = 0.5) -> List[Vec2]:
+    """
+    Flatten a cubic Bezier into a polyline by adaptive de Casteljau subdivision.
+
+    A piece is split at t = 0.5 until both inner control points lie within
+    `tolerance` pixels (L-infinity) of the chord's one-third points, so short
+    or straight pieces produce few vertices and tight bends produce many.
+    An explicit stack replaces recursion.
+
+    Args:
+        p0: Starting point of the curve.
+        p1: First control point.
+        p2: Second control point.
+        p3: End point of the curve.
+        tolerance: Maximum allowed deviation in pixels. Defaults to 0.5.
+
+    Returns:
+        Polyline vertices from p0 to p3, in curve order.
+    """
+    vertices: List[Vec2] = [p0]
+    stack = [(p0, p1, p2, p3, 0)]
+    while stack:
+        q0, q1, q2, q3, depth = stack.pop()
+        deviation = max(
+            abs(q1[0] - (2 * q0[0] + q3[0]) / 3), abs(q1[1] - (2 * q0[1] + q3[1]) / 3),
+            abs(q2[0] - (q0[0] + 2 * q3[0]) / 3), abs(q2[1] - (q0[1] + 2 * q3[1]) / 3),
+        )
+        if deviation <= tolerance or depth >= MAX_SUBDIVISION_DEPTH:
+            vertices.append(q3)
+            continue
+
+        q01 = ((q0[0] + q1[0]) * 0.5, (q0[1] + q1[1]) * 0.5)
+        q12 = ((q1[0] + q2[0]) * 0.5, (q1[1] + q2[1]) * 0.5)
+        q23 = ((q2[0] + q3[0]) * 0.5, (q2[1] + q3[1]) * 0.5)
+        q012 = ((q01[0] + q12[0]) * 0.5, (q01[1] + q12[1]) * 0.5)
+        q123 = ((q12[0] + q23[0]) * 0.5, (q12[1] + q23[1]) * 0.5)
+        mid = ((q012[0] + q123[0]) * 0.5, (q012[1] + q123[1]) * 0.5)
+        # Right half first so the left half is popped (and emitted) first.
+        stack.append((mid, q123, q23, q3, depth + 1))
+        stack.append((q0, q01, q012, mid, depth + 1))
+    return vertices
+
+def cubic_bezier_polyline(p0: Point, p1: Point, p2: Point, p3: Point,
+                          num_segments: Optional[int] = None,
+                          tolerance: float = 0.5) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate the integer polyline approximating a cubic Bezier curve.
+
+    By default the curve is flattened adaptively, so the number of segments
+    follows its length and curvature. Consecutive vertices that round to the
+    same pixel are dropped.
+
+    Args:
+        p0: Starting point of the curve.
+        p1: First control point.
+        p2: Second control point.
+        p3: End point of the curve.
+        num_segments: Fixed number of evenly spaced line segments. If None
+                      (default), adaptive subdivision is used instead.
+        tolerance: Maximum deviation in pixels for adaptive subdivision.
+                   Defaults to 0.5.
+
+    Returns:
+        Tuple (xs, ys) of int32 arrays with the polyline vertices, in curve order.
+    """
+    if num_segments is None:
+        vertices = _flatten((p0.x, p0.y), (p1.x, p1.y), (p2.x, p2.y), (p3.x, p3.y),
+                            tolerance)
+        rounded = np.rint(np.array(vertices, dtype=np.float64)).astype(np.int32)
+        xs, ys = rounded[:, 0], rounded[:, 1]
+    else:
+        xs, ys = _sample_cubic(p0, p1, p2, p3, max(num_segments, 1))
+
+    keep = np.concatenate(([True], (xs[1:] != xs[:-1]) | (ys[1:] != ys[:-1])))
+    return xs[keep], ys[keep]
 
 def cubic_bezier(p0: Point, p1: Point, p2: Point, p3: Point,
                  draw_line_func: LineDrawer,
                  color: pygame.Color,
-                 num_segments: int = 50) -> None:
+                 num_segments: Optional[int] = None,
+                 tolerance: float = 0.5) -> None:
     """
     Draw a cubic Bezier curve by connecting calculated points with line segments.
     
     This implementation provides better visual connectivity by drawing line segments
-    between consecutive points on the curve.
+    between consecutive points on the curve. By default the curve is flattened
+    adaptively, so the number of segments follows its length and curvature.
 
     Args:
         p0: Starting point of the curve.
@@ -34,31 +166,40 @@ def cubic_bezier(p0: Point, p1: Point, p2: Point, p3: Point,
         draw_line_func: Callback function to draw a line segment.
                        Must accept (start_point: Point, end_point: Point, color: pygame.Color).
         color: Color of the curve.
-        num_segments: Number of line segments to use. Defaults to 50.
+        num_segments: Fixed number of evenly spaced line segments. If None
+                      (default), adaptive subdivision is used instead.
+        tolerance: Maximum deviation in pixels for adaptive subdivision.
+                   Defaults to 0.5.
     """
-    if num_segments < 1:
-        num_segments = 1
+    xs, ys = cubic_bezier_polyline(p0, p1, p2, p3, num_segments, tolerance)
 
-    points: List[Point] = []
+    # Each segment's end Point is reused as the next segment's start.
+    points = [Point(x, y) for x, y in zip(xs.tolist(), ys.tolist())]
+    for start, end in zip(points, points[1:]):
+        draw_line_func(start, end, color)
 
-    for i in range(num_segments + 1):
-        t = i / num_segments
+def cubic_bezier_pixels(p0: Point, p1: Point, p2: Point, p3: Point,
+                        num_segments: int = 50) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate the pixels of a cubic Bezier curve sampled point by point.
 
-        one_minus_t = 1 - t
-        b_x = (one_minus_t**3 * p0.x +
-               3 * one_minus_t**2 * t * p1.x +
-               3 * one_minus_t * t**2 * p2.x +
-               t**3 * p3.x)
-        b_y = (one_minus_t**3 * p0.y +
-               3 * one_minus_t**2 * t * p1.y +
-               3 * one_minus_t * t**2 * p2.y +
-               t**3 * p3.y)
+    Consecutive samples that round to the same pixel are dropped.
 
-        points.append(Point(round(b_x), round(b_y)))
+    Args:
+        p0: Starting point of the curve.
+        p1: First control point.
+        p2: Second control point.
+        p3: End point of the curve.
+        num_segments: Number of points to calculate along the curve. Defaults to 50.
+
+    Returns:
+        Tuple (xs, ys) of int32 arrays with the pixel coordinates, in curve order.
+    """
+    if num_segments < 1: num_segments = 1
+    bx, by = _sample_cubic(p0, p1, p2, p3, num_segments)
 
-    for i in range(num_segments):
-        if points[i] != points[i+1]:
-            draw_line_func(points[i], points[i+1], color)
+    keep = np.concatenate(([True], (bx[1:] != bx[:-1]) | (by[1:] != by[:-1])))
+    return bx[keep], by[keep]
 
 def cubic_bezier_points(p0: Point, p1: Point, p2: Point, p3: Point,
                         plot_pixel: PixelPlotter, color: pygame.Color,
@@ -79,16 +220,4 @@ def cubic_bezier_points(p0: Point, p1: Point, p2: Point, p3: Point,
         color: Color of the curve.
         num_segments: Number of points to calculate along the curve. Defaults to 50.
     """
-    if num_segments < 1: num_segments = 1
-    last_x, last_y = -1, -1
-    for i in range(num_segments + 1):
-        t = i / num_segments
-        one_minus_t = 1 - t
-
-        b_x = (one_minus_t**3 * p0.x + 3 * one_minus_t**2 * t * p1.x + 3 * one_minus_t * t**2 * p2.x + t**3 * p3.x)
-        b_y = (one_minus_t**3 * p0.y + 3 * one_minus_t**2 * t * p1.y + 3 * one_minus_t * t**2 * p2.y + t**3 * p3.y)
-
-        pixel_x, pixel_y = round(b_x), round(b_y)
-        if pixel_x != last_x or pixel_y != last_y:
-            plot_pixel(pixel_x, pixel_y, color)
-            last_x, last_y = pixel_x, pixel_y
\ No newline at end of file
+    plot_pixels(*cubic_bezier_pixels(p0, p1, p2, p3, num_segments), plot_pixel, color)
@@ -5,12 +5,151 @@ This module implements the classic Bresenham algorithms for drawing
 lines and circles efficiently on a pixel grid using only integer arithmetic.
 These algorithms are fundamental in computer graphics for rasterizing
 geometric primitives.
+
+Each algorithm is available in two forms: a `*_pixels` function that returns
+the rasterized coordinates as NumPy arrays, suitable for writing to a surface
+in a single batch, and a callback form that plots pixel by pixel.
 """
-from typing import Callable
+import logging
+import math
+from typing import Tuple
+import numpy as np
 import pygame
 from ..geometry.point import Point
+from .plotting import PixelPlotter, plot_pixels, straight_line_pixels
+from ._kernels import NUMBA_AVAILABLE, bresenham_line_into, bresenham_lines_into
+
+logger = logging.getLogger(__name__)
+
+def _bresenham_lines_closed_form(x1s: np.ndarray, y1s: np.ndarray,
+                                 x2s: np.ndarray, y2s: np.ndarray,
+                                 sizes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Rasterize a batch of Bresenham lines with whole-array NumPy operations.
+
+    The line kernel advances the major axis on every step and the minor axis
+    whenever its error term crosses zero, which places step k of a line at
+    (2*k*minor + major - 1) // (2*major) along the minor axis. Used when
+    Numba is not installed, so the kernels would run as Python loops.
+
+    Args:
+        x1s, y1s: int64 arrays with the starting points of the lines.
+        x2s, y2s: int64 arrays with the end points of the lines.
+        sizes: Number of pixels of each line, max(|dx|, |dy|) + 1.
+
+    Returns:
+        Tuple (xs, ys) of int32 arrays with the pixel coordinates of all
+        lines, one line after another.
+    """
+    dx, dy = x2s - x1s, y2s - y1s
+    major = np.maximum(np.abs(dx), np.abs(dy))
+    minor = np.minimum(np.abs(dx), np.abs(dy))
+    x_major = np.abs(dx) >= np.abs(dy)
+
+    line_starts = np.cumsum(sizes) - sizes
+    k = np.arange(sizes.sum(), dtype=np.int64) - np.repeat(line_starts, sizes)
+    major_k = np.repeat(major, sizes)
+    minor_k = (2 * k * np.repeat(minor, sizes) + np.maximum(major_k - 1, 0)) // np.maximum(2 * major_k, 1)
+
+    x_major_k = np.repeat(x_major, sizes)
+    xs = np.repeat(x1s, sizes) + np.repeat(np.sign(dx), sizes) * np.where(x_major_k, k, minor_k)
+    ys = np.repeat(y1s, sizes) + np.repeat(np.sign(dy), sizes) * np.where(x_major_k, minor_k, k)
+    return xs.astype(np.int32), ys.astype(np.int32)
+
+def bresenham_line_pixels(p1: Point, p2: Point) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Rasterize the line between p1 and p2 using Bresenham's line algorithm.
+
+    Args:
+        p1: Starting point of the line.
+        p2: End point of the line.
+
+    Returns:
+        Tuple (xs, ys) of int32 arrays with the pixel coordinates, in order
+        from p1 to p2.
+    """
+    x1, y1 = p1.x, p1.y
+    x2, y2 = p2.x, p2.y
+
+    straight = straight_line_pixels(x1, y1, x2, y2)
+    if straight is not None:
+        return straight
+
+    size: int = max(abs(x2 - x1), abs(y2 - y1)) + 1
+    if not NUMBA_AVAILABLE:
+        return _bresenham_lines_closed_form(np.array([x1]), np.array([y1]),
+                                            np.array([x2]), np.array([y2]),
+                                            np.array([size]))
+    xs = np.empty(size, dtype=np.int32)
+    ys = np.empty(size, dtype=np.int32)
+    count = bresenham_line_into(x1, y1, x2, y2, xs, ys)
+    return xs[:count], ys[:count]
+
+def bresenham_lines_pixels(x1s: np.ndarray, y1s: np.ndarray,
+                           x2s: np.ndarray, y2s: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Rasterize a batch of lines using Bresenham's line algorithm.
+
+    The lines are given as parallel coordinate arrays and rasterized in a
+    single kernel call, so drawing many lines costs one call per batch
+    instead of one per line.
+
+    Args:
+        x1s: Integer array of starting X coordinates.
+        y1s: Integer array of starting Y coordinates.
+        x2s: Integer array of ending X coordinates.
+        y2s: Integer array of ending Y coordinates.
+
+    Returns:
+        Tuple (xs, ys) of int32 arrays with the pixel coordinates of all
+        lines, one line after another.
+    """
+    x1s, y1s = np.asarray(x1s, dtype=np.int64), np.asarray(y1s, dtype=np.int64)
+    x2s, y2s = np.asarray(x2s, dtype=np.int64), np.asarray(y2s, dtype=np.int64)
+
+    sizes = np.maximum(np.abs(x2s - x1s), np.abs(y2s - y1s)) + 1
+    if not NUMBA_AVAILABLE:
+        return _bresenham_lines_closed_form(x1s, y1s, x2s, y2s, sizes)
+    offsets = np.zeros(len(sizes) + 1, dtype=np.int64)
+    np.cumsum(sizes, out=offsets[1:])
+
+    xs = np.empty(offsets[-1], dtype=np.int32)
+    ys = np.empty(offsets[-1], dtype=np.int32)
+    bresenham_lines_into(x1s, y1s, x2s, y2s, offsets, xs, ys)
+    return xs, ys
+
+def bresenham_line_runs(p1: Point, p2: Point) -> np.ndarray:
+    """
+    Rasterize a Bresenham line as a sequence of axis-aligned runs.
+
+    Along the major axis the pixels of a line form a monotone staircase;
+    consecutive pixels sharing the same minor-axis coordinate are merged
+    into one horizontal (or vertical) run, so the line can be painted with
+    one rectangle fill per run instead of one write per pixel.
 
-PixelPlotter = Callable[[int, int, pygame.Color], None]
+    Args:
+        p1: Starting point of the line.
+        p2: End point of the line.
+
+    Returns:
+        int32 array of shape (N, 4) with one (x, y, width, height) rectangle
+        per run, in order from p1 to p2.
+    """
+    xs, ys = bresenham_line_pixels(p1, p2)
+    x_major: bool = abs(p2.x - p1.x) >= abs(p2.y - p1.y)
+    minor = ys if x_major else xs
+
+    starts = np.flatnonzero(np.concatenate(([True], minor[1:] != minor[:-1])))
+    ends = np.append(starts[1:], len(xs)) - 1
+    lengths = ends - starts + 1
+    ones = np.ones_like(lengths)
+
+    runs = np.empty((len(starts), 4), dtype=np.int32)
+    runs[:, 0] = np.minimum(xs[starts], xs[ends])
+    runs[:, 1] = np.minimum(ys[starts], ys[ends])
+    runs[:, 2] = lengths if x_major else ones
+    runs[:, 3] = ones if x_major else lengths
+    return runs
 
 def bresenham_line(p1: Point, p2: Point, plot_pixel: PixelPlotter, color: pygame.Color) -> None:
     """
@@ -23,32 +162,64 @@ def bresenham_line(p1: Point, p2: Point, plot_pixel: PixelPlotter, color: pygame
                    Must accept (x: int, y: int, color: pygame.Color).
         color: Color to draw the line with.
     """
-    x1, y1 = p1.x, p1.y
-    x2, y2 = p2.x, p2.y
+    plot_pixels(*bresenham_line_pixels(p1, p2), plot_pixel, color)
 
-    dx: int = abs(x2 - x1)
-    dy: int = abs(y2 - y1)
+# Signs of the four quadrant reflections (+x+y, -x+y, +x-y, -x-y) of an offset.
+_REFLECT_X: np.ndarray = np.array([1, -1, 1, -1], dtype=np.int64)
+_REFLECT_Y: np.ndarray = np.array([1, 1, -1, -1], dtype=np.int64)
 
-    sx: int = 1 if x1 < x2 else -1
-    sy: int = 1 if y1 < y2 else -1
+def _isqrt(values: np.ndarray) -> np.ndarray:
+    """Exact element-wise integer square root of a non-negative int64 array."""
+    roots = np.sqrt(values.astype(np.float64)).astype(np.int64)
+    roots -= roots * roots > values
+    roots += (roots + 1) * (roots + 1) <= values
+    return roots
 
-    err: int = dx - dy
+def bresenham_circle_pixels(center: Point, radius: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Rasterize a circle using Bresenham's/Midpoint circle algorithm.
 
-    x, y = x1, y1
+    Calculates pixels for one octant and uses symmetry to obtain
+    the complete circle.
 
-    while True:
-        plot_pixel(x, y, color)
+    The midpoint decision keeps y at step x while x^2 + y^2 - y < r^2, so
+    the octant is computed in closed form as the largest such y for every
+    x at once, rather than by iterating the decision variable.
 
-        if x == x2 and y == y2:
-            break
+    Args:
+        center: Center point (x, y) of the circle.
+        radius: Integer radius of the circle. Must be non-negative.
 
-        e2: int = 2 * err
-        if e2 > -dy:
-            err -= dy
-            x += sx
-        if e2 < dx:
-            err += dx
-            y += sy
+    Returns:
+        Tuple (xs, ys) of int32 arrays with the pixel coordinates. Both are
+        empty if the radius is negative.
+    """
+    if radius < 0:
+        logger.debug("Circle radius cannot be negative: %d", radius)
+        return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int32)
+    if radius == 0:
+        return np.array([center.x], dtype=np.int32), np.array([center.y], dtype=np.int32)
+
+    # Octant from (0, r) to the diagonal: y = floor((1 + isqrt(4(r^2 - x^2) - 3)) / 2).
+    ox = np.arange(math.isqrt(radius * radius // 2) + 2, dtype=np.int64)
+    remaining = radius * radius - ox * ox
+    oy = (1 + _isqrt(np.maximum(4 * remaining - 3, 0))) // 2
+    # The step that crosses the diagonal moves y down by at most one pixel.
+    oy[1:] = np.maximum(oy[1:], oy[:-1] - 1)
+    count = int(np.argmax(ox >= oy)) + 1
+    ox, oy = ox[:count], oy[:count]
+
+    # Row i holds the eight reflections of octant point i side by side, so
+    # the output is written in one pass per axis without concatenation.
+    xs = np.empty((count, 8), dtype=np.int32)
+    ys = np.empty((count, 8), dtype=np.int32)
+    xs[:, :4] = ox[:, None] * _REFLECT_X
+    xs[:, 4:] = oy[:, None] * _REFLECT_X
+    ys[:, :4] = oy[:, None] * _REFLECT_Y
+    ys[:, 4:] = ox[:, None] * _REFLECT_Y
+    xs += center.x
+    ys += center.y
+    return xs.ravel(), ys.ravel()
 
 def bresenham_circle(center: Point, radius: int, plot_pixel: PixelPlotter, color: pygame.Color) -> None:
     """
@@ -64,38 +235,4 @@ def bresenham_circle(center: Point, radius: int, plot_pixel: PixelPlotter, color
                    Must accept (x: int, y: int, color: pygame.Color).
         color: Color to draw the circle with.
     """
-    if radius < 0:
-        print("Warning: Circle radius cannot be negative.")
-        return
-    if radius == 0:
-        plot_pixel(center.x, center.y, color)
-        return
-
-    xc, yc = center.x, center.y
-    x: int = 0
-    y: int = radius
-    p: int = 1 - radius
-
-    def _plot_circle_points(center_x: int, center_y: int, current_x: int, current_y: int,
-                           plot_func: PixelPlotter, point_color: pygame.Color) -> None:
-        """Draw the 8 symmetric points of the circle."""
-        plot_func(center_x + current_x, center_y + current_y, point_color)
-        plot_func(center_x - current_x, center_y + current_y, point_color)
-        plot_func(center_x + current_x, center_y - current_y, point_color)
-        plot_func(center_x - current_x, center_y - current_y, point_color)
-        plot_func(center_x + current_y, center_y + current_x, point_color)
-        plot_func(center_x - current_y, center_y + current_x, point_color)
-        plot_func(center_x + current_y, center_y - current_x, point_color)
-        plot_func(center_x - current_y, center_y - current_x, point_color)
-
-    _plot_circle_points(xc, yc, x, y, plot_pixel, color)
-
-    while x < y:
-        x += 1
-        if p < 0:
-            p += 2 * x + 1
-        else:
-            y -= 1
-            p += 2 * (x - y) + 1
-
-        _plot_circle_points(xc, yc, x, y, plot_pixel, color)
\ No newline at end of file
+    plot_pixels(*bresenham_circle_pixels(center, radius), plot_pixel, color)
@@ -6,26 +6,32 @@ pixel grid. DDA is a simple line rasterization algorithm based on the
 calculation of increments.
 """
 
-from typing import Callable
+from typing import Tuple
 from ..geometry.point import Point
+from .plotting import PixelPlotter, plot_pixels, straight_line_pixels
+from ._kernels import NUMBA_AVAILABLE, dda_line_into
+import numpy as np
 import pygame
 
-PixelPlotter = Callable[[int, int, pygame.Color], None]
-
-def dda_line(p1: Point, p2: Point, plot_pixel: PixelPlotter, color: pygame.Color) -> None:
+def dda_line_pixels(p1: Point, p2: Point) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Draw a line between p1 and p2 using the DDA algorithm.
+    Rasterize the line between p1 and p2 using the DDA algorithm.
 
     Args:
         p1: Starting point of the line.
         p2: End point of the line.
-        plot_pixel: Callback function to draw an individual pixel.
-                   Must accept (x: int, y: int, color: pygame.Color).
-        color: Color to draw the line with.
+
+    Returns:
+        Tuple (xs, ys) of int32 arrays with the pixel coordinates, in order
+        from p1 to p2.
     """
     x1, y1 = p1.x, p1.y
     x2, y2 = p2.x, p2.y
 
+    straight = straight_line_pixels(x1, y1, x2, y2)
+    if straight is not None:
+        return straight
+
     dx: int = x2 - x1
     dy: int = y2 - y1
 
@@ -35,17 +41,28 @@ def dda_line(p1: Point, p2: Point, plot_pixel: PixelPlotter, color: pygame.Color
     else:
         steps = abs(dy)
 
-    if steps == 0:
-        plot_pixel(x1, y1, color)
-        return
+    if NUMBA_AVAILABLE:
+        xs = np.empty(steps + 1, dtype=np.int32)
+        ys = np.empty(steps + 1, dtype=np.int32)
+        count = dda_line_into(x1, y1, x2, y2, xs, ys)
+        return xs[:count], ys[:count]
 
-    x_increment: float = dx / steps
-    y_increment: float = dy / steps
+    # Position i is computed directly as p1 + i * increment instead of being
+    # accumulated step by step, so long lines do not drift.
+    i = np.arange(steps + 1, dtype=np.float64)
+    xs = np.rint(x1 + i * (dx / steps)).astype(np.int32)
+    ys = np.rint(y1 + i * (dy / steps)).astype(np.int32)
+    return xs, ys
 
-    x: float = float(x1)
-    y: float = float(y1)
+def dda_line(p1: Point, p2: Point, plot_pixel: PixelPlotter, color: pygame.Color) -> None:
+    """
+    Draw a line between p1 and p2 using the DDA algorithm.
 
-    for _ in range(steps + 1):
-        plot_pixel(round(x), round(y), color)
-        x += x_increment
-        y += y_increment
\ No newline at end of file
+    Args:
+        p1: Starting point of the line.
+        p2: End point of the line.
+        plot_pixel: Callback function to draw an individual pixel.
+                   Must accept (x: int, y: int, color: pygame.Color).
+        color: Color to draw the line with.
+    """
+    plot_pixels(*dda_line_pixels(p1, p2), plot_pixel, color)
@@ -0,0 +1,54 @@
+"""
+Pixel plotting helpers shared by the drawing algorithms.
+
+Defines the callback type used by the pixel-by-pixel algorithm variants, the
+helper that feeds a batch of rasterized coordinates to such a callback, and a
+shortcut for the lines every line algorithm rasterizes identically.
+"""
+from typing import Callable, Optional
+
+import numpy as np
+import pygame
+
+PixelPlotter = Callable[[int, int, pygame.Color], None]
+
+def plot_pixels(xs: np.ndarray, ys: np.ndarray,
+                plot_pixel: PixelPlotter, color: pygame.Color) -> None:
+    """
+    Invoke a pixel callback for each rasterized coordinate pair.
+
+    Args:
+        xs: Integer array of X coordinates.
+        ys: Integer array of Y coordinates, same length as xs.
+        plot_pixel: Callback function to draw an individual pixel.
+                   Must accept (x: int, y: int, color: pygame.Color).
+        color: Color to draw the pixels with.
+    """
+    for x, y in zip(xs.tolist(), ys.tolist()):
+        plot_pixel(x, y, color)
+
+def straight_line_pixels(x1: int, y1: int,
+                         x2: int, y2: int) -> Optional[tuple[np.ndarray, np.ndarray]]:
+    """
+    Rasterize a horizontal, vertical or 45-degree line directly.
+
+    Along these lines every pixel advances by exactly one step on each moving
+    axis, so no error term or increment is needed.
+
+    Args:
+        x1, y1: Starting point of the line.
+        x2, y2: End point of the line.
+
+    Returns:
+        Tuple (xs, ys) of int32 arrays with the pixel coordinates, in order
+        from the start to the end point, or None if the line has any other slope.
+    """
+    dx = x2 - x1
+    dy = y2 - y1
+    if dx != 0 and dy != 0 and abs(dx) != abs(dy):
+        return None
+
+    steps = np.arange(max(abs(dx), abs(dy)) + 1, dtype=np.int32)
+    xs = x1 + ((dx > 0) - (dx < 0)) * steps
+    ys = y1 + ((dy > 0) - (dy < 0)) * steps
+    return xs, ys
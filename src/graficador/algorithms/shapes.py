@@ -5,67 +5,82 @@ This module implements algorithms for drawing shapes like ellipses
 using efficient techniques such as the midpoint algorithm.
 """
 
-from typing import Callable
+import logging
+from typing import Tuple
+import numpy as np
 import pygame
 from ..geometry.point import Point
+from .plotting import PixelPlotter, plot_pixels
+from ._kernels import ellipse_into
 
-PixelPlotter = Callable[[int, int, pygame.Color], None]
+logger = logging.getLogger(__name__)
 
-def midpoint_ellipse(center: Point, rx: int, ry: int, plot_pixel: PixelPlotter, color: pygame.Color) -> None:
+def midpoint_ellipse_pixels(center: Point, rx: int, ry: int) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Draw an ellipse using the midpoint algorithm.
+    Rasterize an ellipse using the midpoint algorithm.
 
     The algorithm divides the calculation into two regions based on the slope
-    of the curve and uses quadruple symmetry to draw the complete ellipse.
+    of the curve and uses quadruple symmetry to obtain the complete ellipse.
 
     Args:
         center: Center point (xc, yc) of the ellipse.
         rx: Horizontal radius (semi-major axis in x). Must be positive.
         ry: Vertical radius (semi-major axis in y). Must be positive.
-        plot_pixel: Callback function to draw an individual pixel.
-                   Must accept (x: int, y: int, color: pygame.Color).
-        color: Color to draw the ellipse with.
+
+    Returns:
+        Tuple (xs, ys) of int32 arrays with the pixel coordinates. Both are
+        empty if a radius is not positive, except for the degenerate 0x0
+        ellipse, which yields the center pixel.
     """
     if rx <= 0 or ry <= 0:
-        print("Warning: Ellipse radii must be positive.")
+        logger.debug("Ellipse radii must be positive: rx=%d, ry=%d", rx, ry)
         if rx == 0 and ry == 0:
-             plot_pixel(center.x, center.y, color)
-        return
+            return np.array([center.x], dtype=np.int32), np.array([center.y], dtype=np.int32)
+        return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int32)
+
+    size: int = 4 * (rx + ry + 1)
+    xs = np.empty(size, dtype=np.int32)
+    ys = np.empty(size, dtype=np.int32)
+    count = ellipse_into(center.x, center.y, rx, ry, xs, ys)
+    return xs[:count], ys[:count]
 
-    xc, yc = center.x, center.y
-    rx_sq: int = rx * rx
-    ry_sq: int = ry * ry
+def rectangle_outline_rects(p1: Point, p2: Point) -> np.ndarray:
+    """
+    Decompose the outline of a rectangle into its four edge spans.
 
-    def _plot_ellipse_points(center_x: int, center_y: int, current_x: int, current_y: int,
-                            plot_func: PixelPlotter, point_color: pygame.Color) -> None:
-        """Draw the 4 symmetric points of the ellipse."""
-        plot_func(center_x + current_x, center_y + current_y, point_color)
-        plot_func(center_x - current_x, center_y + current_y, point_color)
-        plot_func(center_x + current_x, center_y - current_y, point_color)
-        plot_func(center_x - current_x, center_y - current_y, point_color)
+    Each edge is a one-pixel-wide span that includes both corners, so filling
+    the spans lights the same pixels as four Bresenham lines between the
+    corners, also when the rectangle is cropped by the surface.
 
-    x: int = 0
-    y: int = ry
-    p1: float = ry_sq - rx_sq * ry + 0.25 * rx_sq
+    Args:
+        p1: First rectangle corner.
+        p2: Opposite rectangle corner.
 
-    _plot_ellipse_points(xc, yc, x, y, plot_pixel, color)
+    Returns:
+        int32 array of shape (4, 4) with one (x, y, width, height) row per
+        edge: top, bottom, left and right.
+    """
+    x0, y0 = min(p1.x, p2.x), min(p1.y, p2.y)
+    x1, y1 = max(p1.x, p2.x), max(p1.y, p2.y)
+    width, height = x1 - x0 + 1, y1 - y0 + 1
+    return np.array([
+        (x0, y0, width, 1), (x0, y1, width, 1),
+        (x0, y0, 1, height), (x1, y0, 1, height),
+    ], dtype=np.int32)
 
-    while (ry_sq * x) < (rx_sq * y):
-        x += 1
-        if p1 < 0:
-            p1 += 2 * ry_sq * x + ry_sq
-        else:
-            y -= 1
-            p1 += 2 * ry_sq * x - 2 * rx_sq * y + ry_sq
-        _plot_ellipse_points(xc, yc, x, y, plot_pixel, color)
+def midpoint_ellipse(center: Point, rx: int, ry: int, plot_pixel: PixelPlotter, color: pygame.Color) -> None:
+    """
+    Draw an ellipse using the midpoint algorithm.
 
-    p2: float = ry_sq * (x + 0.5)**2 + rx_sq * (y - 1)**2 - rx_sq * ry_sq
+    The algorithm divides the calculation into two regions based on the slope
+    of the curve and uses quadruple symmetry to draw the complete ellipse.
 
-    while y >= 0:
-        y -= 1
-        if p2 > 0:
-            p2 += -2 * rx_sq * y + rx_sq
-        else:
-            x += 1
-            p2 += 2 * ry_sq * x - 2 * rx_sq * y + rx_sq
-        _plot_ellipse_points(xc, yc, x, y, plot_pixel, color)
\ No newline at end of file
+    Args:
+        center: Center point (xc, yc) of the ellipse.
+        rx: Horizontal radius (semi-major axis in x). Must be positive.
+        ry: Vertical radius (semi-major axis in y). Must be positive.
+        plot_pixel: Callback function to draw an individual pixel.
+                   Must accept (x: int, y: int, color: pygame.Color).
+        color: Color to draw the ellipse with.
+    """
+    plot_pixels(*midpoint_ellipse_pixels(center, rx, ry), plot_pixel, color)
@@ -8,21 +8,33 @@ interaction with controls. Integrates geometric drawing algorithms and
 necessary data structures for interactive figure creation.
 """
 
+import inspect
+import logging
+import numpy as np
 import pygame
 import math
 import os
-from typing import List, Optional, Tuple, cast
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union, cast
 import io
-import traceback
 
 from . import config
 from .ui.canvas import Canvas
 from .ui.controls import Controls
+from .ui.cached_font import CachedFont
 from .geometry.point import Point
-from .algorithms.dda import dda_line
-from .algorithms.bresenham import bresenham_line, bresenham_circle
-from .algorithms.bezier import cubic_bezier
-from .algorithms.shapes import midpoint_ellipse
+from .geometry.point_buffer import PointBuffer
+from .geometry.clipping import box_outside
+from .algorithms.dda import dda_line_pixels
+from .algorithms.bresenham import (
+    bresenham_line_pixels, bresenham_line_runs, bresenham_lines_pixels, bresenham_circle_pixels
+)
+from .algorithms.bezier import cubic_bezier_polyline
+from .algorithms.shapes import midpoint_ellipse_pixels, rectangle_outline_rects
+
+logger = logging.getLogger(__name__)
 
 try:
     from google import genai
@@ -34,7 +46,77 @@ except ImportError:
     types = None
     PILImage = None
     GEMINI_AVAILABLE = False
-    print("WARNING: 'google-genai' and/or 'Pillow' libraries not installed. AI functionality will not be available.")
+    logger.warning("'google-genai' and/or 'Pillow' libraries not installed. AI functionality will not be available.")
+
+def _make_marker(color: pygame.Color, radius: int = 4) -> pygame.Surface:
+    """
+    Pre-render a filled circle marker on a transparent surface.
+
+    Args:
+        color: Marker fill color.
+        radius: Marker radius in pixels. Defaults to 4.
+
+    Returns:
+        A (2*radius+1)-pixel square SRCALPHA surface with the circle centered.
+    """
+    size = 2 * radius + 1
+    marker = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.circle(marker, color, (radius, radius), radius)
+    return marker
+
+def _bezier_stroke_pixels(p0: Point, p1: Point, p2: Point, p3: Point) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate the pixels of a cubic Bezier curve stroked with Bresenham lines.
+
+    Args:
+        p0: Starting point (anchor point 1).
+        p1: First control point.
+        p2: Second control point.
+        p3: End point (anchor point 2).
+
+    Returns:
+        Tuple (xs, ys) of int32 arrays with the pixels of every polyline segment.
+    """
+    xs, ys = cubic_bezier_polyline(p0, p1, p2, p3)
+    return bresenham_lines_pixels(xs[:-1], ys[:-1], xs[1:], ys[1:])
+
+def _decode_image_bytes(image_data_bytes: bytes) -> Optional[pygame.Surface]:
+    """
+    Decode an encoded image (PNG, JPEG, ...) into a pygame surface.
+
+    pygame decodes the bytes straight into a surface. PIL is only used as a
+    fallback for formats pygame cannot read, with the decoded pixels wrapped
+    by `pygame.image.frombuffer` instead of being copied again.
+
+    Args:
+        image_data_bytes: Encoded image data.
+
+    Returns:
+        The decoded surface, or None if neither decoder can read the data.
+    """
+    try:
+        surface = pygame.image.load(io.BytesIO(image_data_bytes))
+    except pygame.error as load_err:
+        logger.debug("pygame could not decode image (%s). Falling back to PIL.", load_err)
+    else:
+        if surface.get_bitsize() < 24:
+            # Palette and grayscale images are expanded so smoothscale accepts them.
+            expanded = pygame.Surface(surface.get_size(), pygame.SRCALPHA, 32)
+            expanded.blit(surface, (0, 0))
+            surface = expanded
+        return surface
+
+    if not PILImage:
+        return None
+    pil_image = PILImage.open(io.BytesIO(image_data_bytes))
+    if pil_image.mode not in ('RGB', 'RGBA'):
+        logger.warning("Image mode not directly supported: %s. Trying to convert to RGBA.", pil_image.mode)
+        try:
+            pil_image = pil_image.convert('RGBA')
+        except Exception as convert_err:
+            logger.error("Error converting PIL image to RGBA: %s", convert_err)
+            return None
+    return pygame.image.frombuffer(pil_image.tobytes(), pil_image.size, pil_image.mode)
 
 class Application:
     """
@@ -53,11 +135,11 @@ class Application:
         current_tool: Active drawing tool identifier
         line_start_point: Start point for drawing lines
         circle_center: Center point for drawing circles
-        bezier_points: List of control points for Bézier curves
-        triangle_points: List of vertices for drawing triangles
-        rectangle_points: List of opposite corners for drawing rectangles
-        polygon_points: List of vertices for drawing polygons
-        ellipse_points: List of points (center, edge) for drawing ellipses
+        bezier_points: Buffer of control points for Bézier curves
+        triangle_points: Buffer of vertices for drawing triangles
+        rectangle_points: Buffer of opposite corners for drawing rectangles
+        polygon_points: Buffer of vertices for drawing polygons
+        ellipse_points: Buffer of points (center, edge) for drawing ellipses
         draw_color: Currently selected drawing color
         is_drawing: Flag to know if currently drawing
         last_mouse_pos_for_pixel_draw: Last mouse position for pixel drawing
@@ -70,6 +152,8 @@ class Application:
         veo_operation_name: Current Veo operation name
         current_veo_operation_object: Current Veo operation object
         VEO_POLLING_EVENT: Custom event for Veo polling
+        GEMINI_DONE_EVENT: Custom event posted when a Gemini request finishes
+        VEO_DONE_EVENT: Custom event posted when a Veo start or poll finishes
     """
     
     def __init__(self) -> None:
@@ -80,6 +164,8 @@ class Application:
             pygame.font.init()
         self.ui_font_small: pygame.font.Font = pygame.font.SysFont("Arial", 12)
         self.ui_font_normal: pygame.font.Font = pygame.font.SysFont("Arial", 16)
+        # Status and prompt lines are re-rendered every drawn frame.
+        self._status_font: CachedFont = CachedFont(self.ui_font_normal)
 
         self.screen: pygame.Surface = pygame.display.set_mode(
             (config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
@@ -105,14 +191,24 @@ class Application:
         self.current_tool: str = "pixel"
         self.line_start_point: Optional[Point] = None
         self.circle_center: Optional[Point] = None
-        self.bezier_points: List[Point] = []
-        self.triangle_points: List[Point] = []
-        self.rectangle_points: List[Point] = []
-        self.polygon_points: List[Point] = []
-        self.ellipse_points: List[Point] = []
-        self.draw_color: pygame.Color = config.BLACK
+        self.bezier_points: PointBuffer = PointBuffer(4)
+        self.triangle_points: PointBuffer = PointBuffer(3)
+        self.rectangle_points: PointBuffer = PointBuffer(2)
+        self.polygon_points: PointBuffer = PointBuffer()
+        self.ellipse_points: PointBuffer = PointBuffer(2)
+        self.draw_color = config.BLACK
         self.is_drawing: bool = False
         self.last_mouse_pos_for_pixel_draw: Optional[Point] = None
+        self._mouse_abs: Tuple[int, int] = (0, 0)
+        self._mouse_on_canvas: bool = False
+        self._mouse_on_controls: bool = False
+
+        # Point markers for the previews, keyed by the RGBA tuple of their color.
+        self._markers: Dict[Tuple[int, ...], pygame.Surface] = {
+            tuple(color): _make_marker(color)
+            for color in (config.RED, config.GREEN, config.BLUE, config.DARK_GRAY,
+                          config.MAGENTA, config.ORANGE, config.CYAN)
+        }
         
         self.gemini_client: Optional[genai.Client] = None
         self.is_typing_prompt: bool = False
@@ -122,62 +218,174 @@ class Application:
         self.is_veo_processing: bool = False
         self.veo_operation_name: Optional[str] = None
         self.current_veo_operation_object: Optional[any] = None
+        self._veo_poll_interval_ms: int = config.VEO_POLLING_INTERVAL_MS
         self.VEO_POLLING_EVENT = pygame.USEREVENT + 1
+        self.GEMINI_DONE_EVENT = pygame.USEREVENT + 2
+        self.VEO_DONE_EVENT = pygame.USEREVENT + 3
+
+        # Veo calls, downloads included, run off the main loop and report back
+        # through VEO_DONE_EVENT. Each started generation is a new session, so
+        # results of a cancelled one can be recognized and dropped.
+        self._veo_executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="veo"
+        )
+        self._veo_job: Optional[Future] = None
+        self._veo_session: int = 0
+        # Last image sent to Veo, with the canvas revision it was encoded from.
+        self._veo_image_cache: Optional[Tuple[int, Any]] = None
+        # Whether files.download can stream into a file; set with the client.
+        self._veo_stream_downloads: bool = False
+
+        # Gemini requests run off the main loop and report back through
+        # GEMINI_DONE_EVENT. A single worker keeps jobs from writing the
+        # shared scale buffers at the same time.
+        self._gemini_executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="gemini"
+        )
+        self._gemini_job: Optional[Future] = None
+        # Canvas-sized destinations for scaling generated images, per pixel format.
+        self._ai_scale_bufs: Dict[Tuple[Any, ...], pygame.Surface] = {}
+
+        # Curve and ellipse pixels are computed on a worker thread; the main
+        # thread paints finished jobs onto the canvas in submission order.
+        self._raster_executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="raster"
+        )
+        self._raster_jobs: Deque[Tuple[Future, int]] = deque()
+
+        # The first frame presents the whole window; later frames only
+        # present the regions that can change (see `_render`).
+        self._full_redraw: bool = True
+        self._last_preview_rects: List[pygame.Rect] = []
+        # Strip along the bottom edge where the status or prompt line is drawn.
+        self._status_area_rect: pygame.Rect = pygame.Rect(
+            0, config.SCREEN_HEIGHT - 40, config.SCREEN_WIDTH, 40
+        )
+        self._wake_event: Optional[pygame.event.Event] = None
+        # Blink period of the prompt cursor shown by the last drawn frame.
+        self._drawn_blink_period: int = -1
+        # Prompt mode and text of the status line shown by the last drawn frame.
+        self._drawn_status_key: Optional[Tuple[bool, str]] = None
+
+        # Let SDL drop every event type the app does not handle before it is
+        # queued. Mouse motion is only let through while a freehand stroke is
+        # in progress; hover and previews read the mouse position directly.
+        # Expose events are kept so an uncovered or restored window, whose
+        # contents the dirty-rect updates would not repaint, is presented again.
+        pygame.event.set_blocked(None)
+        self._handled_event_types: List[int] = [
+            pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN,
+            pygame.MOUSEBUTTONUP, pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE,
+            self.VEO_POLLING_EVENT, self.GEMINI_DONE_EVENT, self.VEO_DONE_EVENT
+        ]
+        pygame.event.set_allowed(self._handled_event_types)
         
+        self._api_key_present: bool = bool(os.environ.get("GOOGLE_API_KEY"))
         self._initialize_gemini()
 
-        print(f"Application initialized. Current tool: {self.current_tool}")
+        logger.debug("Application initialized. Current tool: %s", self.current_tool)
         
         if GEMINI_AVAILABLE and self.gemini_client:
-            print(f"Gemini client ready to use with model: {config.GEMINI_MODEL_NAME}")
+            logger.debug("Gemini client ready to use with model: %s", config.GEMINI_MODEL_NAME)
         else:
-            print(f"Gemini status at initialization end: {self.gemini_status_message}")
+            logger.debug("Gemini status at initialization end: %s", self.gemini_status_message)
+
+    @property
+    def draw_color(self) -> pygame.Color:
+        """Current drawing color."""
+        return self._draw_color
+
+    @draw_color.setter
+    def draw_color(self, color: pygame.Color) -> None:
+        # Keep the color in the canvas pixel format alongside, so rasterizers
+        # are handed a packed integer.
+        self._draw_color: pygame.Color = color
+        self._draw_color_mapped: int = self.canvas.map_color(color)
 
     def _initialize_gemini(self) -> None:
         """Initialize Gemini client if libraries and API key are available."""
         if not GEMINI_AVAILABLE:
             self.gemini_status_message = config.GEMINI_STATUS_ERROR_LIB
-            print(f"WARNING: {self.gemini_status_message} AI libraries not available.")
+            logger.warning("%s AI libraries not available.", self.gemini_status_message)
             return
 
         try:
             api_key = os.environ.get("GOOGLE_API_KEY")
             if not api_key:
                 self.gemini_status_message = config.GEMINI_STATUS_ERROR_API_KEY
-                print(f"WARNING: {self.gemini_status_message}")
+                logger.warning("%s", self.gemini_status_message)
                 return
 
             self.gemini_client = genai.Client(api_key=api_key)
+            # google-genai only streams downloads to a destination in newer releases.
+            self._veo_stream_downloads = "destination" in inspect.signature(
+                self.gemini_client.files.download
+            ).parameters
             self.gemini_status_message = config.GEMINI_STATUS_DEFAULT
-            print("Gemini client initialized successfully using 'google-genai' SDK.")
+            logger.debug("Gemini client initialized successfully using 'google-genai' SDK.")
 
         except Exception as e:
             self.gemini_status_message = f"Error initializing Gemini: {str(e)[:150]}"
-            print(f"GENERAL ERROR IN _initialize_gemini: {self.gemini_status_message}")
-            traceback.print_exc()
+            logger.exception("GENERAL ERROR IN _initialize_gemini: %s", self.gemini_status_message)
             self.gemini_client = None
 
-    def _draw_dda_line(self, p1: Point, p2: Point, color: pygame.Color) -> None:
+    def _line_outside_canvas(self, p1: Point, p2: Point) -> bool:
+        """
+        Check whether a line cannot light any canvas pixel.
+
+        Every pixel of a rasterized line lies within the bounding box of its
+        endpoints, so the line is only skipped when that box misses the canvas.
+        Partly visible lines are rasterized from their original endpoints and
+        the off-canvas pixels are discarded when painting: rasterizing the
+        clipped endpoints instead would light a different set of pixels.
+
+        Args:
+            p1: Line start point (canvas relative coordinates)
+            p2: Line end point (canvas relative coordinates)
+
+        Returns:
+            True if the line lies entirely outside the canvas.
+        """
+        return box_outside(min(p1.x, p2.x), min(p1.y, p2.y), max(p1.x, p2.x), max(p1.y, p2.y),
+                           self.canvas.rect.width, self.canvas.rect.height)
+
+    def _draw_dda_line(self, p1: Point, p2: Point, color: Union[pygame.Color, int]) -> None:
         """
         Draw a line using the DDA algorithm.
 
         Args:
             p1: Line start point (canvas relative coordinates)
             p2: Line end point (canvas relative coordinates)
-            color: Line color
+            color: Line color, or a color mapped by `Canvas.map_color`
         """
-        dda_line(p1, p2, self.canvas.draw_pixel, color)
+        if self._line_outside_canvas(p1, p2):
+            return
+        if p1.x == p2.x or p1.y == p2.y:
+            # Axis-aligned lines are a single span, painted with one fill.
+            self.canvas.fill_rects(bresenham_line_runs(p1, p2), color)
+        else:
+            self.canvas.put_pixels(*dda_line_pixels(p1, p2), color)
 
-    def _draw_bresenham_line(self, p1: Point, p2: Point, color: pygame.Color) -> None:
+    def _draw_bresenham_line(self, p1: Point, p2: Point, color: Union[pygame.Color, int]) -> None:
         """
         Draw a line using Bresenham's algorithm.
 
+        Horizontal, vertical and nearly axis-aligned lines are painted run by
+        run with rectangle fills; other lines are written as a batch of pixels.
+
         Args:
             p1: Line start point (canvas relative coordinates)
             p2: Line end point (canvas relative coordinates)
-            color: Line color
+            color: Line color, or a color mapped by `Canvas.map_color`
         """
-        bresenham_line(p1, p2, self.canvas.draw_pixel, color)
+        if self._line_outside_canvas(p1, p2):
+            return
+        dx = abs(p2.x - p1.x)
+        dy = abs(p2.y - p1.y)
+        if dx == 0 or dy == 0 or max(dx, dy) + 1 >= (min(dx, dy) + 1) * config.LINE_RUN_MIN_LENGTH:
+            self.canvas.fill_rects(bresenham_line_runs(p1, p2), color)
+        else:
+            self.canvas.put_pixels(*bresenham_line_pixels(p1, p2), color)
 
     def _draw_bresenham_circle(self, center: Point, radius: int) -> None:
         """
@@ -188,74 +396,94 @@ class Application:
             radius: Circle radius in pixels
         """
         if radius >= 0:
-            bresenham_circle(center, radius, self.canvas.draw_pixel, self.draw_color)
+            if box_outside(center.x - radius, center.y - radius, center.x + radius, center.y + radius,
+                           self.canvas.rect.width, self.canvas.rect.height):
+                return
+            self._submit_raster(bresenham_circle_pixels, center, radius)
         else:
-            print("Error: Circle radius cannot be negative.")
+            logger.error("Circle radius cannot be negative.")
 
-    def _draw_bezier_curve(self, points: List[Point]) -> None:
+    def _draw_bezier_curve(self, points: PointBuffer) -> None:
         """
         Draw a cubic Bézier curve using the corresponding algorithm.
 
         The curve is drawn by segmenting it and drawing straight lines
-        (using Bresenham) between calculated points.
+        (using Bresenham) between calculated points, all rasterized as one batch.
 
         Args:
-            points: List of 4 control points (P0, P1, P2, P3) in canvas relative coordinates
+            points: Buffer of 4 control points (P0, P1, P2, P3) in canvas relative coordinates
         """
         if len(points) == 4:
-            cubic_bezier(points[0], points[1], points[2], points[3],
-                         self._draw_bresenham_line, self.draw_color)
+            # The curve lies inside the bounding box of its control points.
+            (x_min, y_min), (x_max, y_max) = points.array.min(axis=0), points.array.max(axis=0)
+            if box_outside(x_min, y_min, x_max, y_max, self.canvas.rect.width, self.canvas.rect.height):
+                return
+            self._submit_raster(_bezier_stroke_pixels, points[0], points[1], points[2], points[3])
+
+    def _draw_edges(self, vertices: np.ndarray, closed: bool) -> None:
+        """
+        Draw the straight edges joining consecutive vertices in one call.
+
+        Uses `pygame.draw.lines`, which matches Bresenham's algorithm for
+        lines inside the canvas, unless `config.BRESENHAM_EDGES` selects the
+        batch Bresenham rasterizer.
+
+        Args:
+            vertices: Array of shape (N, 2) with canvas relative vertices
+            closed: Whether to also join the last vertex to the first one
+        """
+        color = self._draw_color_mapped
+        if not config.BRESENHAM_EDGES:
+            self.canvas.mark_dirty(
+                pygame.draw.lines(self.canvas.surface, color, closed, vertices.tolist())
+            )
+            return
+        xs, ys = vertices[:, 0], vertices[:, 1]
+        x2s, y2s = np.roll(xs, -1), np.roll(ys, -1)
+        if not closed:
+            xs, ys, x2s, y2s = xs[:-1], ys[:-1], x2s[:-1], y2s[:-1]
+        self.canvas.put_pixels(*bresenham_lines_pixels(xs, ys, x2s, y2s), color)
 
-    def _draw_triangle(self, points: List[Point]) -> None:
+    def _draw_triangle(self, points: PointBuffer) -> None:
         """
-        Draw a triangle connecting the 3 given vertices with lines (Bresenham).
+        Draw a triangle connecting the 3 given vertices with lines.
 
         Args:
-            points: List of 3 points (vertices) of the triangle in canvas relative coordinates
+            points: Buffer of 3 points (vertices) of the triangle in canvas relative coordinates
         """
         if len(points) == 3:
-            print(f"Drawing Triangle: {points[0]}, {points[1]}, {points[2]}")
-            self._draw_bresenham_line(points[0], points[1], self.draw_color)
-            self._draw_bresenham_line(points[1], points[2], self.draw_color)
-            self._draw_bresenham_line(points[2], points[0], self.draw_color)
+            logger.debug("Drawing Triangle: %s, %s, %s", points[0], points[1], points[2])
+            self._draw_edges(points.array, closed=True)
 
     def _draw_rectangle(self, p_start: Point, p_end: Point) -> None:
         """
-        Draw a rectangle defined by two opposite corners using lines (Bresenham).
+        Draw the outline of a rectangle defined by two opposite corners.
+
+        The four axis-aligned edges are filled as one-pixel-wide spans that
+        include both corners, matching four Bresenham lines between them.
+        `pygame.draw.rect` is not used: it clips an outline whose corners are
+        off the canvas differently from the lines.
 
         Args:
             p_start: First rectangle corner (canvas relative)
             p_end: Opposite rectangle corner (canvas relative)
         """
-        x0, y0 = p_start.x, p_start.y
-        x1, y1 = p_end.x, p_end.y
-        
-        p1 = Point(x1, y0)
-        p3 = Point(x0, y1)
-        print(f"Drawing Rectangle: P0={p_start}, P1={p1}, P2={p_end}, P3={p3}")
-        
-        self._draw_bresenham_line(p_start, p1, self.draw_color)
-        self._draw_bresenham_line(p1, p_end, self.draw_color)
-        self._draw_bresenham_line(p_end, p3, self.draw_color)
-        self._draw_bresenham_line(p3, p_start, self.draw_color)
+        logger.debug("Drawing Rectangle: %s -> %s", p_start, p_end)
+        self.canvas.fill_rects(rectangle_outline_rects(p_start, p_end), self._draw_color_mapped)
 
-    def _draw_polygon(self, points: List[Point]) -> None:
+    def _draw_polygon_segment(self, a: Point, b: Point) -> None:
         """
-        Draw polygon segments connecting given vertices with lines (Bresenham).
+        Draw the newest side of a polygon with a line.
 
-        Note: This function draws segments as points are added.
-        Polygon closure (last vertex to first) is handled in `_handle_events`.
+        Note: Sides are drawn one at a time as vertices are added.
+        Polygon closure (last vertex to first) is handled in `_handle_polygon_click`.
 
         Args:
-            points: List of polygon vertices so far (canvas relative coordinates)
+            a: Previous vertex (canvas relative coordinates)
+            b: Newly added vertex (canvas relative coordinates)
         """
-        if len(points) < 2:
-            return
-        
-        start_point = points[-2]
-        end_point = points[-1]
-        print(f"  Drawing polygon side: {start_point} -> {end_point}")
-        self._draw_bresenham_line(start_point, end_point, self.draw_color)
+        logger.debug("  Drawing polygon side: %s -> %s", a, b)
+        self._draw_edges(np.array((a, b)), closed=False)
 
     def _draw_ellipse(self, center: Point, rx: int, ry: int) -> None:
         """
@@ -267,26 +495,64 @@ class Application:
             ry: Vertical radius (major or minor semi-axis) in pixels
         """
         if rx >= 0 and ry >= 0:
-            midpoint_ellipse(center, rx, ry, self.canvas.draw_pixel, self.draw_color)
+            if box_outside(center.x - rx, center.y - ry, center.x + rx, center.y + ry,
+                           self.canvas.rect.width, self.canvas.rect.height):
+                return
+            self._submit_raster(midpoint_ellipse_pixels, center, rx, ry)
         else:
-            print("Error: Ellipse radii cannot be negative.")
+            logger.error("Ellipse radii cannot be negative.")
+
+    def _submit_raster(self, rasterizer: Callable[..., Tuple[np.ndarray, np.ndarray]], *args: Any) -> None:
+        """
+        Compute a shape's pixels on the raster worker thread.
+
+        The pixels are painted with the current drawing color by
+        `_paint_raster_jobs` once the job has finished.
+
+        Args:
+            rasterizer: Function returning the (xs, ys) pixel arrays of the shape.
+            *args: Arguments passed to `rasterizer`.
+        """
+        future = self._raster_executor.submit(rasterizer, *args)
+        self._raster_jobs.append((future, self._draw_color_mapped))
+
+    def _paint_raster_jobs(self, wait: bool = False) -> None:
+        """
+        Paint finished raster jobs onto the canvas in submission order.
+
+        Args:
+            wait: If True, block until every pending job is painted; otherwise
+                stop at the first job that is still running.
+        """
+        while self._raster_jobs:
+            future, color = self._raster_jobs[0]
+            if not wait and not future.done():
+                break
+            self._raster_jobs.popleft()
+            try:
+                xs, ys = future.result()
+            except Exception:
+                logger.exception("Rasterization job failed.")
+                continue
+            self.canvas.put_pixels(xs, ys, color)
 
     def _reset_drawing_states(self) -> None:
         """Reset only pending drawing states (points, etc.)."""
-        print("Resetting only pending drawing states...")
+        logger.debug("Resetting only pending drawing states...")
         self.line_start_point = None
         self.circle_center = None
-        self.bezier_points = []
-        self.triangle_points = []
-        self.rectangle_points = []
-        self.polygon_points = []
-        self.ellipse_points = []
+        self.bezier_points.clear()
+        self.triangle_points.clear()
+        self.rectangle_points.clear()
+        self.polygon_points.clear()
+        self.ellipse_points.clear()
 
     def _reset_all_states(self) -> None:
         """Reset all drawing AND AI states."""
         self._reset_drawing_states()
         self.is_typing_prompt = False
         self.current_prompt_text = ""
+        self._full_redraw = True
         
         self.current_veo_operation_object = None
         if self.is_veo_processing:
@@ -299,10 +565,10 @@ class Application:
         else:
             if not GEMINI_AVAILABLE:
                 self.gemini_status_message = config.GEMINI_STATUS_ERROR_LIB
-            elif not os.environ.get("GOOGLE_API_KEY"):
+            elif not self._api_key_present:
                 self.gemini_status_message = config.GEMINI_STATUS_ERROR_API_KEY
         
-        print(f"ALL states reset. Current AI status: {self.gemini_status_message}")
+        logger.debug("ALL states reset. Current AI status: %s", self.gemini_status_message)
 
     def _capture_canvas_as_pil_image(self) -> Optional[PILImage.Image]:
         """
@@ -313,44 +579,284 @@ class Application:
         """
         if not PILImage:
             self.gemini_status_message = config.GEMINI_STATUS_ERROR_LIB
-            print(f"Error: {self.gemini_status_message}")
+            logger.error("%s", self.gemini_status_message)
             return None
         
+        self._paint_raster_jobs(wait=True)
         try:
             canvas_surface = self.canvas.surface
-            image_bytes_io = io.BytesIO()
-            pygame.image.save(canvas_surface, image_bytes_io, "PNG")
-            image_bytes_io.seek(0)
-            pil_image = PILImage.open(image_bytes_io)
-            print("Canvas captured as PIL image.")
+            raw_pixels = pygame.image.tobytes(canvas_surface, "RGB")
+            # Wrap the immutable bytes instead of copying them into a new image.
+            pil_image = PILImage.frombuffer("RGB", canvas_surface.get_size(), raw_pixels,
+                                            "raw", "RGB", 0, 1)
+            logger.debug("Canvas captured as PIL image.")
             return pil_image
         except Exception as e:
             self.gemini_status_message = f"Error capturing canvas: {str(e)[:100]}"
-            print(f"Error: {self.gemini_status_message}")
+            logger.error("%s", self.gemini_status_message)
             return None
 
+    def _sample_mouse(self) -> None:
+        """
+        Read the mouse position once per frame.
+
+        The position and whether it lies on the canvas or the control panel
+        are cached for `_handle_events` and `_render`.
+        """
+        self._mouse_abs = pygame.mouse.get_pos()
+        self._mouse_on_canvas = bool(self.canvas.rect.collidepoint(self._mouse_abs))
+        self._mouse_on_controls = bool(self.controls.rect.collidepoint(self._mouse_abs))
+
+    def _handle_pixel_click(self, point: Point) -> None:
+        """
+        Start freehand drawing with the pixel tool.
+
+        Args:
+            point: Clicked point relative to the canvas.
+        """
+        self.is_drawing = True
+        pygame.event.set_allowed(pygame.MOUSEMOTION)
+        self.canvas.draw_pixel(point.x, point.y, self._draw_color_mapped)
+        self.last_mouse_pos_for_pixel_draw = point
+
+    def _handle_line_click(self, point: Point) -> None:
+        """
+        Collect the endpoints of a DDA or Bresenham line and draw it.
+
+        Args:
+            point: Clicked point relative to the canvas.
+        """
+        if not self.line_start_point:
+            self.line_start_point = point
+            return
+        if self.current_tool == "dda_line":
+            self._draw_dda_line(self.line_start_point, point, self._draw_color_mapped)
+        else:
+            self._draw_bresenham_line(self.line_start_point, point, self._draw_color_mapped)
+        self.line_start_point = None
+
+    def _handle_circle_click(self, point: Point) -> None:
+        """
+        Collect the center and a rim point of a circle and draw it.
+
+        Args:
+            point: Clicked point relative to the canvas.
+        """
+        if not self.circle_center:
+            self.circle_center = point
+            return
+        dx = point.x - self.circle_center.x
+        dy = point.y - self.circle_center.y
+        radius = math.isqrt(dx*dx + dy*dy)
+        self._draw_bresenham_circle(self.circle_center, radius)
+        self.circle_center = None
+
+    def _handle_ellipse_click(self, point: Point) -> None:
+        """
+        Collect the center and a corner point of an ellipse and draw it.
+
+        Args:
+            point: Clicked point relative to the canvas.
+        """
+        self.ellipse_points.append(point)
+        if len(self.ellipse_points) == 2:
+            center = self.ellipse_points[0]
+            rx = abs(point.x - center.x)
+            ry = abs(point.y - center.y)
+            self._draw_ellipse(center, rx, ry)
+            self.ellipse_points.clear()
+
+    def _handle_bezier_click(self, point: Point) -> None:
+        """
+        Collect the four control points of a Bezier curve and draw it.
+
+        Args:
+            point: Clicked point relative to the canvas.
+        """
+        self.bezier_points.append(point)
+        if len(self.bezier_points) == 4:
+            self._draw_bezier_curve(self.bezier_points)
+            self.bezier_points.clear()
+
+    def _handle_triangle_click(self, point: Point) -> None:
+        """
+        Collect the three vertices of a triangle and draw it.
+
+        Args:
+            point: Clicked point relative to the canvas.
+        """
+        self.triangle_points.append(point)
+        if len(self.triangle_points) == 3:
+            self._draw_triangle(self.triangle_points)
+            self.triangle_points.clear()
+
+    def _handle_rectangle_click(self, point: Point) -> None:
+        """
+        Collect two opposite corners of a rectangle and draw it.
+
+        Args:
+            point: Clicked point relative to the canvas.
+        """
+        self.rectangle_points.append(point)
+        if len(self.rectangle_points) == 2:
+            self._draw_rectangle(self.rectangle_points[0], self.rectangle_points[1])
+            self.rectangle_points.clear()
+
+    def _handle_polygon_click(self, point: Point) -> None:
+        """
+        Add a polygon vertex, or close the polygon when clicking near the first one.
+
+        Args:
+            point: Clicked point relative to the canvas.
+        """
+        should_close = False
+        if len(self.polygon_points) >= 2:
+            first_point = self.polygon_points[0]
+            dx = point.x - first_point.x
+            dy = point.y - first_point.y
+            if dx*dx + dy*dy < config.POLYGON_CLOSE_THRESHOLD_SQ:
+                should_close = True
+
+        if should_close:
+            self._draw_polygon_segment(self.polygon_points[-1], self.polygon_points[0])
+            self.polygon_points.clear()
+        else:
+            self.polygon_points.append(point)
+            if len(self.polygon_points) >= 2:
+                self._draw_polygon_segment(self.polygon_points[-2], self.polygon_points[-1])
+
+    # Canvas click handler per drawing tool; tools without an entry ignore canvas clicks.
+    _TOOL_HANDLERS: Dict[str, Callable[["Application", Point], None]] = {
+        "pixel": _handle_pixel_click,
+        "dda_line": _handle_line_click,
+        "bresenham_line": _handle_line_click,
+        "bresenham_circle": _handle_circle_click,
+        "ellipse": _handle_ellipse_click,
+        "bezier_curve": _handle_bezier_click,
+        "triangle": _handle_triangle_click,
+        "rectangle": _handle_rectangle_click,
+        "polygon": _handle_polygon_click,
+    }
+
+    def _is_idle(self) -> bool:
+        """
+        Check whether the next frame would look exactly like the last one.
+
+        Previews and hover only depend on the mouse position, and every other
+        state change arrives as an event, so a frame with no queued events,
+        an unmoved mouse and no pending rasterization can be skipped. While
+        typing a prompt, the blinking cursor also needs a frame every time
+        it toggles. The queue is peeked by type: peeking without a type
+        returns a copy of the first event, and freeing that copy drops the
+        attributes of events posted with `pygame.event.post`.
+
+        Returns:
+            True if event handling and rendering can be skipped this frame.
+        """
+        return not (self._full_redraw
+                    or self._wake_event is not None
+                    or (self.is_typing_prompt
+                        and pygame.time.get_ticks() // 500 != self._drawn_blink_period)
+                    or self._raster_jobs
+                    or pygame.event.peek(self._handled_event_types)
+                    or pygame.mouse.get_pos() != self._mouse_abs)
+
+    def _draw_stroke(self, stroke: List[Tuple[int, int]]) -> None:
+        """
+        Draw the freehand motion collected in one frame as a single polyline.
+
+        The polyline continues from the last drawn stroke point, and the
+        collected points are consumed.
+
+        Args:
+            stroke: Canvas relative mouse positions in the order they arrived
+        """
+        if not stroke:
+            return
+        last_pos = self.last_mouse_pos_for_pixel_draw
+        points = [last_pos] + stroke if last_pos else stroke
+        if len(points) > 1:
+            self.canvas.mark_dirty(
+                pygame.draw.lines(self.canvas.surface, self._draw_color_mapped, False, points)
+            )
+        self.last_mouse_pos_for_pixel_draw = Point(*stroke[-1])
+        stroke.clear()
+
+    def _wait_for_input(self) -> None:
+        """
+        Sleep until an event arrives or `config.IDLE_WAIT_TIMEOUT_MS` expires.
+
+        Mouse motion is let through while waiting so that hover and previews
+        wake the loop; unless a freehand stroke is in progress the motion
+        event itself is dropped, since the mouse position is sampled every
+        frame. Any other event is kept for `_handle_events`.
+        """
+        motion_blocked = pygame.event.get_blocked(pygame.MOUSEMOTION)
+        if motion_blocked:
+            pygame.event.set_allowed(pygame.MOUSEMOTION)
+        event = pygame.event.wait(config.IDLE_WAIT_TIMEOUT_MS)
+        if motion_blocked:
+            pygame.event.set_blocked(pygame.MOUSEMOTION)
+            if event.type == pygame.MOUSEMOTION:
+                return
+        if event.type != pygame.NOEVENT:
+            self._wake_event = event
+
     def _handle_events(self) -> None:
         """
         Handle user input events (keyboard, mouse), including logic for
         starting and monitoring video generation with Veo.
         """
+        # Objects that never change while handling events are bound once.
+        # Tool and color are not: a click in the same batch may change them.
+        controls = self.controls
+        controls_rect = controls.rect
+        canvas = self.canvas
+        canvas_rect = canvas.rect
+
+        abs_mouse_pos = self._mouse_abs
         mouse_pos_on_controls: Optional[Tuple[int, int]] = None
-        abs_mouse_pos: Tuple[int, int] = pygame.mouse.get_pos()
-        if self.controls.rect.collidepoint(abs_mouse_pos):
-            mouse_pos_on_controls = (abs_mouse_pos[0] - self.controls.rect.x,
-                                     abs_mouse_pos[1] - self.controls.rect.y)
+        if self._mouse_on_controls:
+            mouse_pos_on_controls = (abs_mouse_pos[0] - controls_rect.x,
+                                     abs_mouse_pos[1] - controls_rect.y)
+
+        controls.update(mouse_pos_on_controls)
+
+        # Freehand motion is collected here and drawn once per frame.
+        canvas_x, canvas_y = canvas_rect.topleft
+        stroke: List[Tuple[int, int]] = []
+        add_to_stroke = stroke.append
+
+        events = pygame.event.get()
+        if self._wake_event is not None:
+            events.insert(0, self._wake_event)
+            self._wake_event = None
 
-        self.controls.update(mouse_pos_on_controls)
+        for event in events:
+            # Any other event may depend on the canvas or end the stroke.
+            if stroke and event.type != pygame.MOUSEMOTION:
+                self._draw_stroke(stroke)
 
-        for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.is_running = False
                 continue
 
+            if event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                self._full_redraw = True
+                continue
+
             if event.type == self.VEO_POLLING_EVENT:
                 self._poll_veo_status()
                 continue
 
+            if event.type == self.GEMINI_DONE_EVENT:
+                self._apply_gemini_result(event)
+                continue
+
+            if event.type == self.VEO_DONE_EVENT:
+                self._apply_veo_result(event)
+                continue
+
             if self.is_veo_processing:
                 continue
 
@@ -360,24 +866,29 @@ class Application:
                     prompt_final = self.current_prompt_text.strip()
                     if not prompt_final:
                         self.gemini_status_message = "Empty prompt. Try again."
-                        print("Attempt to generate with empty prompt.")
+                        logger.debug("Attempt to generate with empty prompt.")
                     elif not self.gemini_client:
                         self.gemini_status_message = "Error: AI not initialized."
-                        print("Attempt to generate without AI client.")
+                        logger.debug("Attempt to generate without AI client.")
+                    elif self._gemini_job is not None:
+                        self.gemini_status_message = config.GEMINI_STATUS_LOADING
+                        logger.debug("Attempt to generate while a Gemini request is running.")
                     else:
-                        print(f"Prompt finalized: '{prompt_final}'. Starting image generation...")
+                        logger.debug("Prompt finalized: '%s'. Starting image generation...", prompt_final)
                         self.gemini_status_message = config.GEMINI_STATUS_LOADING
                         pil_image = self._capture_canvas_as_pil_image()
                         if pil_image:
-                           self._call_gemini_api(pil_image, prompt_final)
+                            self._gemini_job = self._gemini_executor.submit(
+                                self._run_gemini_job, pil_image, prompt_final
+                            )
                         else:
                             self.gemini_status_message = "Error: Could not capture canvas for Gemini."
-                            print(self.gemini_status_message)
+                            logger.debug("%s", self.gemini_status_message)
 
                 elif event.key == pygame.K_BACKSPACE:
                     self.current_prompt_text = self.current_prompt_text[:-1]
                 elif event.key == pygame.K_ESCAPE:
-                    print("Prompt input cancelled.")
+                    logger.debug("Prompt input cancelled.")
                     self._reset_all_states()
                 else:
                     if len(self.current_prompt_text) < 200:
@@ -386,8 +897,11 @@ class Application:
 
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:
-                    if mouse_pos_on_controls:
-                        click_result = self.controls.handle_click(mouse_pos_on_controls)
+                    click_pos: Tuple[int, int] = event.pos
+                    if controls_rect.collidepoint(click_pos):
+                        click_result = controls.handle_click(
+                            (click_pos[0] - controls_rect.x, click_pos[1] - controls_rect.y)
+                        )
                         if click_result:
                             click_type, value = click_result
                             if click_type == "tool":
@@ -402,7 +916,7 @@ class Application:
                                             self.gemini_status_message = config.VEO_STATUS_ERROR_API
                                     else:
                                         self.gemini_status_message = config.VEO_STATUS_PROCESSING_ANOTHER_OP
-                                    print(self.gemini_status_message)
+                                    logger.debug("%s", self.gemini_status_message)
 
                                 elif tool_id == "gemini_generate":
                                     if GEMINI_AVAILABLE and self.gemini_client:
@@ -412,139 +926,73 @@ class Application:
                                             self.gemini_status_message = config.PROMPT_INPUT_PLACEHOLDER
                                             self.current_tool = "gemini_generate"
                                             self._reset_drawing_states()
-                                            print("Gemini prompt writing mode activated.")
+                                            logger.debug("Gemini prompt writing mode activated.")
                                     else:
                                         self.gemini_status_message = "Error: AI not available/configured."
-                                    print(self.gemini_status_message)
+                                    logger.debug("%s", self.gemini_status_message)
 
                                 elif tool_id == "clear":
-                                    self.canvas.clear()
+                                    self._paint_raster_jobs(wait=True)
+                                    canvas.clear()
                                     self._reset_all_states()
-                                    print("Canvas cleared and states reset.")
+                                    logger.debug("Canvas cleared and states reset.")
                                     
                                     if self.is_veo_processing:
                                         pygame.time.set_timer(self.VEO_POLLING_EVENT, 0)
                                         self.is_veo_processing = False
                                         self.veo_operation_name = None
                                         self.gemini_status_message = "Veo processing cancelled by cleanup."
-                                        print(self.gemini_status_message)
+                                        logger.debug("%s", self.gemini_status_message)
 
                                 elif self.current_tool != tool_id:
                                     if self.is_typing_prompt:
                                         self._reset_all_states()
                                     self.current_tool = tool_id
                                     self._reset_drawing_states()
-                                    print(f"Tool changed to: {tool_id}")
+                                    logger.debug("Tool changed to: %s", tool_id)
                                 else:
                                     self._reset_drawing_states()
-                                    print(f"Tool {tool_id} points reset.")
+                                    logger.debug("Tool %s points reset.", tool_id)
 
                             elif click_type == "color":
                                 color_value = cast(pygame.Color, value)
                                 if self.draw_color != color_value:
                                     self.draw_color = color_value
-                                    print(f"Drawing color changed to: {color_value}")
+                                    logger.debug("Drawing color changed to: %s", color_value)
                     
-                    elif self.canvas.rect.collidepoint(abs_mouse_pos):
-                        relative_x = abs_mouse_pos[0] - self.canvas.rect.x
-                        relative_y = abs_mouse_pos[1] - self.canvas.rect.y
+                    elif canvas_rect.collidepoint(click_pos):
+                        relative_x = click_pos[0] - canvas_x
+                        relative_y = click_pos[1] - canvas_y
                         current_point = Point(relative_x, relative_y)
                         
-                        if self.current_tool == "pixel":
-                            self.is_drawing = True
-                            self.canvas.draw_pixel(current_point.x, current_point.y, self.draw_color)
-                            self.last_mouse_pos_for_pixel_draw = current_point
-                        
-                        elif self.current_tool in ["dda_line", "bresenham_line"]:
-                            if not self.line_start_point:
-                                self.line_start_point = current_point
-                            else:
-                                if self.current_tool == "dda_line":
-                                    self._draw_dda_line(self.line_start_point, current_point, self.draw_color)
-                                else:
-                                    self._draw_bresenham_line(self.line_start_point, current_point, self.draw_color)
-                                self.line_start_point = None
-                        
-                        elif self.current_tool == "bresenham_circle":
-                            if not self.circle_center:
-                                self.circle_center = current_point
-                            else:
-                                dx = current_point.x - self.circle_center.x
-                                dy = current_point.y - self.circle_center.y
-                                radius = int(math.sqrt(dx*dx + dy*dy))
-                                self._draw_bresenham_circle(self.circle_center, radius)
-                                self.circle_center = None
-                        
-                        elif self.current_tool == "ellipse":
-                            self.ellipse_points.append(current_point)
-                            if len(self.ellipse_points) == 2:
-                                center = self.ellipse_points[0]
-                                rx = abs(current_point.x - center.x)
-                                ry = abs(current_point.y - center.y)
-                                self._draw_ellipse(center, rx, ry)
-                                self.ellipse_points = []
-                        
-                        elif self.current_tool == "bezier_curve":
-                            self.bezier_points.append(current_point)
-                            if len(self.bezier_points) == 4:
-                                self._draw_bezier_curve(self.bezier_points)
-                                self.bezier_points = []
-                        
-                        elif self.current_tool == "triangle":
-                            self.triangle_points.append(current_point)
-                            if len(self.triangle_points) == 3:
-                                self._draw_triangle(self.triangle_points)
-                                self.triangle_points = []
-                        
-                        elif self.current_tool == "rectangle":
-                            self.rectangle_points.append(current_point)
-                            if len(self.rectangle_points) == 2:
-                                self._draw_rectangle(self.rectangle_points[0], self.rectangle_points[1])
-                                self.rectangle_points = []
-                        
-                        elif self.current_tool == "polygon":
-                            should_close = False
-                            if len(self.polygon_points) >= 2:
-                                first_point = self.polygon_points[0]
-                                distance_to_first = math.sqrt(
-                                    (current_point.x - first_point.x)**2 + 
-                                    (current_point.y - first_point.y)**2
-                                )
-                                if distance_to_first < config.POLYGON_CLOSE_THRESHOLD:
-                                    should_close = True
-                            
-                            if should_close:
-                                if len(self.polygon_points) >= 2:
-                                    self._draw_bresenham_line(self.polygon_points[-1], self.polygon_points[0], self.draw_color)
-                                self.polygon_points = []
-                            else:
-                                self.polygon_points.append(current_point)
-                                if len(self.polygon_points) >= 2:
-                                    self._draw_polygon(self.polygon_points)
+                        handler = self._TOOL_HANDLERS.get(self.current_tool)
+                        if handler:
+                            # Earlier shapes must land before this click draws anything.
+                            self._paint_raster_jobs(wait=True)
+                            handler(self, current_point)
 
             elif event.type == pygame.MOUSEMOTION:
                 if self.is_drawing and self.current_tool == "pixel":
-                    if pygame.mouse.get_pressed()[0] and self.canvas.rect.collidepoint(abs_mouse_pos):
-                        current_mouse_pos_relative = self.canvas.to_relative_pos(Point(*abs_mouse_pos))
-                        if self.last_mouse_pos_for_pixel_draw and self.last_mouse_pos_for_pixel_draw != current_mouse_pos_relative:
-                            self._draw_bresenham_line(self.last_mouse_pos_for_pixel_draw, current_mouse_pos_relative, self.draw_color)
-                        self.last_mouse_pos_for_pixel_draw = current_mouse_pos_relative
+                    if event.buttons[0] and canvas_rect.collidepoint(event.pos):
+                        add_to_stroke((event.pos[0] - canvas_x, event.pos[1] - canvas_y))
             
             elif event.type == pygame.MOUSEBUTTONUP:
                 if event.button == 1: 
                     if self.is_drawing:
                         self.is_drawing = False
                         self.last_mouse_pos_for_pixel_draw = None
+                        pygame.event.set_blocked(pygame.MOUSEMOTION)
 
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self._reset_drawing_states()
-                    print("Pending drawing points reset by ESC.")
+                    logger.debug("Pending drawing points reset by ESC.")
                 
                 elif event.key == pygame.K_c:
-                    self.canvas.clear()
+                    self._paint_raster_jobs(wait=True)
+                    canvas.clear()
                     self._reset_all_states()
-                    print("Canvas cleared and all states reset by 'C' shortcut.")
+                    logger.debug("Canvas cleared and all states reset by 'C' shortcut.")
 
                 elif event.key == pygame.K_g:
                     if GEMINI_AVAILABLE and self.gemini_client:
@@ -553,10 +1001,10 @@ class Application:
                         self.gemini_status_message = config.PROMPT_INPUT_PLACEHOLDER
                         self.current_tool = "gemini_generate"
                         self._reset_drawing_states()
-                        print("Gemini prompt writing mode activated by 'G' shortcut.")
+                        logger.debug("Gemini prompt writing mode activated by 'G' shortcut.")
                     else:
                         self.gemini_status_message = "Error: AI not available/configured."
-                        print(self.gemini_status_message)
+                        logger.debug("%s", self.gemini_status_message)
                 
                 elif event.key == pygame.K_v:
                     if not self.is_veo_processing and not self.is_typing_prompt:
@@ -567,136 +1015,177 @@ class Application:
                             self.gemini_status_message = config.VEO_STATUS_ERROR_API
                     else:
                         self.gemini_status_message = config.VEO_STATUS_PROCESSING_ANOTHER_OP
-                    print(self.gemini_status_message)
+                    logger.debug("%s", self.gemini_status_message)
+
+        self._draw_stroke(stroke)
 
     def _render(self) -> None:
         """
         Draw all visible elements on screen.
 
-        Clears screen, draws canvas (which may now contain AI-generated image),
-        control panel, prompt/status UI, and visual tool feedback.
-        Finally updates the Pygame screen.
+        Restores the canvas (which may now contain AI-generated image) where
+        needed, then draws the control panel, prompt/status UI and visual tool
+        feedback. Finally updates the changed regions of the Pygame screen.
         """
-        self.screen.fill(config.WINDOW_BG_COLOR)
-        self.canvas.render(self.screen)
-        self.controls.render(self.screen, self.current_tool, self.draw_color)
-
-        status_area_rect = pygame.Rect(0, config.SCREEN_HEIGHT - 40, config.SCREEN_WIDTH, 40)
+        # Bind attributes used repeatedly below to locals once per frame.
+        screen = self.screen
+        canvas = self.canvas
+        markers = self._markers
+        light_gray = config.LIGHT_GRAY
+        to_abs = canvas.to_absolute_pos
+        to_abs_bulk = canvas.to_absolute_bulk
+        draw_line = pygame.draw.line
+        draw_lines = pygame.draw.lines
+
+        # Canvas and control panel tile the whole window. After the first
+        # frame only canvas regions that changed or were covered by last
+        # frame's previews and status bar are restored; the panel is blitted
+        # whole from its cached surface.
+        canvas_dirty_rects = canvas.take_dirty_rects()
+        status_area_rect = self._status_area_rect
+        if self._full_redraw:
+            screen.fill(config.WINDOW_BG_COLOR)
+            canvas.render(screen)
+        else:
+            canvas_rect = canvas.rect
+            canvas_x, canvas_y = canvas_rect.topleft
+            for rect in canvas_dirty_rects + self._last_preview_rects + [status_area_rect]:
+                rect = rect.clip(canvas_rect)
+                if rect.width and rect.height:
+                    screen.blit(canvas.surface, rect.topleft, rect.move(-canvas_x, -canvas_y))
+        controls_changed = self.controls.render(screen, self.current_tool, self.draw_color)
+
+        status_text = self.gemini_status_message
         if self.is_typing_prompt:
-            cursor = "_" if (pygame.time.get_ticks() // 500) % 2 == 0 else ""
+            self._drawn_blink_period = pygame.time.get_ticks() // 500
+            cursor = "_" if self._drawn_blink_period % 2 == 0 else ""
             prompt_text_render = f"{config.PROMPT_ACTIVE_PREFIX}{self.current_prompt_text}{cursor}"
-            prompt_surf = self.ui_font_normal.render(prompt_text_render, True, config.PROMPT_INPUT_TEXT_COLOR, config.PROMPT_INPUT_BG_COLOR)
-            prompt_rect = prompt_surf.get_rect(centerx=self.screen.get_rect().centerx, bottom=config.SCREEN_HEIGHT - 10)
+            status_text = prompt_text_render
+            prompt_surf = self._status_font.render(prompt_text_render, True, config.PROMPT_INPUT_TEXT_COLOR, config.PROMPT_INPUT_BG_COLOR)
+            prompt_rect = prompt_surf.get_rect(centerx=screen.get_rect().centerx, bottom=config.SCREEN_HEIGHT - 10)
             prompt_rect.left = max(10, prompt_rect.left)
             prompt_rect.right = min(config.SCREEN_WIDTH - 10, prompt_rect.right)
             
             bg_rect = prompt_rect.inflate(10, 6)
             bg_rect.width = min(bg_rect.width, config.SCREEN_WIDTH - 20)
-            bg_rect.centerx = self.screen.get_rect().centerx
-            pygame.draw.rect(self.screen, config.PROMPT_INPUT_BG_COLOR, bg_rect, border_radius=3)
-            pygame.draw.rect(self.screen, config.DARK_GRAY, bg_rect, 1, border_radius=3)
-            self.screen.blit(prompt_surf, prompt_rect)
+            bg_rect.centerx = screen.get_rect().centerx
+            pygame.draw.rect(screen, config.PROMPT_INPUT_BG_COLOR, bg_rect, border_radius=3)
+            pygame.draw.rect(screen, config.DARK_GRAY, bg_rect, 1, border_radius=3)
+            screen.blit(prompt_surf, prompt_rect)
         elif self.gemini_status_message:
-            status_surf = self.ui_font_normal.render(self.gemini_status_message, True, config.STATUS_MESSAGE_COLOR)
-            status_rect = status_surf.get_rect(centerx=self.screen.get_rect().centerx, bottom=config.SCREEN_HEIGHT - 10)
+            status_surf = self._status_font.render(self.gemini_status_message, True, config.STATUS_MESSAGE_COLOR)
+            status_rect = status_surf.get_rect(centerx=screen.get_rect().centerx, bottom=config.SCREEN_HEIGHT - 10)
             status_rect.left = max(10, status_rect.left)
             status_rect.right = min(config.SCREEN_WIDTH - 10, status_rect.right)
             
             bg_rect_status = status_rect.inflate(10, 6)
             bg_rect_status.width = min(bg_rect_status.width, config.SCREEN_WIDTH - 20)
-            bg_rect_status.centerx = self.screen.get_rect().centerx
-            pygame.draw.rect(self.screen, config.LIGHT_GRAY, bg_rect_status, border_radius=3)
-            self.screen.blit(status_surf, status_rect)
+            bg_rect_status.centerx = screen.get_rect().centerx
+            pygame.draw.rect(screen, light_gray, bg_rect_status, border_radius=3)
+            screen.blit(status_surf, status_rect)
 
-        mouse_pos_abs = pygame.mouse.get_pos()
-        mouse_on_canvas = self.canvas.rect.collidepoint(mouse_pos_abs)
+        mouse_pos_abs = self._mouse_abs
+        mouse_on_canvas = self._mouse_on_canvas
 
+        # Bounding rects of everything drawn over the canvas this frame.
+        preview_rects: List[pygame.Rect] = []
         if not self.is_typing_prompt:
-            for i, p in enumerate(self.bezier_points):
-                p_abs = self.canvas.to_absolute_pos(p)
-                pygame.draw.circle(self.screen, config.RED, p_abs, 4)
-                if i > 0:
-                    prev_p_abs = self.canvas.to_absolute_pos(self.bezier_points[i-1])
-                    pygame.draw.line(self.screen, config.LIGHT_GRAY, prev_p_abs, p_abs, 1)
-            if self.bezier_points and mouse_on_canvas:
-                last_p_abs = self.canvas.to_absolute_pos(self.bezier_points[-1])
-                pygame.draw.line(self.screen, config.LIGHT_GRAY, last_p_abs, mouse_pos_abs, 1)
-
-            for i, p in enumerate(self.triangle_points):
-                p_abs = self.canvas.to_absolute_pos(p)
-                pygame.draw.circle(self.screen, config.GREEN, p_abs, 4)
-                if i > 0:
-                    prev_p_abs = self.canvas.to_absolute_pos(self.triangle_points[i-1])
-                    pygame.draw.line(self.screen, config.LIGHT_GRAY, prev_p_abs, p_abs, 1)
-            if self.triangle_points and mouse_on_canvas:
-                last_p_abs = self.canvas.to_absolute_pos(self.triangle_points[-1])
-                pygame.draw.line(self.screen, config.LIGHT_GRAY, last_p_abs, mouse_pos_abs, 1)
-                if len(self.triangle_points) == 2:
-                    first_p_abs = self.canvas.to_absolute_pos(self.triangle_points[0])
-                    pygame.draw.line(self.screen, config.LIGHT_GRAY, mouse_pos_abs, first_p_abs, 1)
-
-            for p in self.rectangle_points:
-                pygame.draw.circle(self.screen, config.BLUE, self.canvas.to_absolute_pos(p), 4)
+            # Each preview polyline (placed points plus the mouse) is drawn
+            # with a single pygame.draw.lines call.
+            bezier_abs = to_abs_bulk(self.bezier_points.array).tolist()
+            marker = markers[tuple(config.RED)]
+            preview_rects.extend(screen.blits([(marker, (x - 4, y - 4)) for x, y in bezier_abs]))
+            if bezier_abs and mouse_on_canvas:
+                bezier_abs.append(mouse_pos_abs)
+            if len(bezier_abs) >= 2:
+                preview_rects.append(draw_lines(screen, light_gray, False, bezier_abs, 1))
+
+            triangle_abs = to_abs_bulk(self.triangle_points.array).tolist()
+            marker = markers[tuple(config.GREEN)]
+            preview_rects.extend(screen.blits([(marker, (x - 4, y - 4)) for x, y in triangle_abs]))
+            if triangle_abs and mouse_on_canvas:
+                triangle_abs.append(mouse_pos_abs)
+            if len(triangle_abs) >= 2:
+                preview_rects.append(draw_lines(screen, light_gray, len(triangle_abs) == 3, triangle_abs, 1))
+
+            marker = markers[tuple(config.BLUE)]
+            preview_rects.extend(screen.blits([(marker, (x - 4, y - 4)) for x, y in
+                                              to_abs_bulk(self.rectangle_points.array).tolist()]))
             if len(self.rectangle_points) == 1 and mouse_on_canvas:
-                p_start_abs = self.canvas.to_absolute_pos(self.rectangle_points[0])
+                p_start_abs = to_abs(self.rectangle_points[0])
                 x0, y0 = p_start_abs
                 x1, y1 = mouse_pos_abs
                 preview_rect = pygame.Rect(min(x0, x1), min(y0, y1), abs(x1 - x0), abs(y1 - y0))
-                pygame.draw.rect(self.screen, config.LIGHT_GRAY, preview_rect, 1)
+                preview_rects.append(pygame.draw.rect(screen, light_gray, preview_rect, 1))
 
-            for i, p in enumerate(self.polygon_points):
-                p_abs = self.canvas.to_absolute_pos(p)
-                pygame.draw.circle(self.screen, config.DARK_GRAY, p_abs, 4)
+            marker = markers[tuple(config.DARK_GRAY)]
+            preview_rects.extend(screen.blits([(marker, (x - 4, y - 4)) for x, y in
+                                              to_abs_bulk(self.polygon_points.array).tolist()]))
             if self.polygon_points and mouse_on_canvas:
-                last_p_abs = self.canvas.to_absolute_pos(self.polygon_points[-1])
-                pygame.draw.line(self.screen, config.LIGHT_GRAY, last_p_abs, mouse_pos_abs, 1)
+                last_p_abs = to_abs(self.polygon_points[-1])
+                preview_rects.append(draw_line(screen, light_gray, last_p_abs, mouse_pos_abs, 1))
                 if len(self.polygon_points) >= 2:
-                    first_p_abs = self.canvas.to_absolute_pos(self.polygon_points[0])
+                    first_p_abs = to_abs(self.polygon_points[0])
                     dx = mouse_pos_abs[0] - first_p_abs[0]
                     dy = mouse_pos_abs[1] - first_p_abs[1]
-                    dist_sq = dx*dx + dy*dy 
-                    close_color = config.YELLOW if dist_sq < config.POLYGON_CLOSE_THRESHOLD**2 else config.LIGHT_GRAY
-                    pygame.draw.line(self.screen, close_color, mouse_pos_abs, first_p_abs, 1)
+                    dist_sq = dx*dx + dy*dy
+                    close_color = config.YELLOW if dist_sq < config.POLYGON_CLOSE_THRESHOLD_SQ else light_gray
+                    preview_rects.append(draw_line(screen, close_color, mouse_pos_abs, first_p_abs, 1))
 
             if len(self.ellipse_points) == 1:
-                center_abs = self.canvas.to_absolute_pos(self.ellipse_points[0])
-                pygame.draw.circle(self.screen, config.MAGENTA, center_abs, 4)
+                center_abs = to_abs(self.ellipse_points[0])
+                preview_rects.append(screen.blit(markers[tuple(config.MAGENTA)], (center_abs[0] - 4, center_abs[1] - 4)))
                 if mouse_on_canvas:
                     rx = abs(mouse_pos_abs[0] - center_abs[0])
                     ry = abs(mouse_pos_abs[1] - center_abs[1])
                     if rx > 0 and ry > 0:
                         preview_rect = pygame.Rect(center_abs[0] - rx, center_abs[1] - ry, 2*rx, 2*ry)
-                        pygame.draw.ellipse(self.screen, config.LIGHT_GRAY, preview_rect, 1)
+                        preview_rects.append(pygame.draw.ellipse(screen, light_gray, preview_rect, 1))
 
             if self.line_start_point:
-                start_p_abs = self.canvas.to_absolute_pos(self.line_start_point)
-                pygame.draw.circle(self.screen, config.ORANGE, start_p_abs, 4)
+                start_p_abs = to_abs(self.line_start_point)
+                preview_rects.append(screen.blit(markers[tuple(config.ORANGE)], (start_p_abs[0] - 4, start_p_abs[1] - 4)))
                 if mouse_on_canvas:
-                    pygame.draw.line(self.screen, config.LIGHT_GRAY, start_p_abs, mouse_pos_abs, 1)
+                    preview_rects.append(draw_line(screen, light_gray, start_p_abs, mouse_pos_abs, 1))
 
             if self.circle_center:
-                center_abs = self.canvas.to_absolute_pos(self.circle_center)
-                pygame.draw.circle(self.screen, config.CYAN, center_abs, 4)
+                center_abs = to_abs(self.circle_center)
+                preview_rects.append(screen.blit(markers[tuple(config.CYAN)], (center_abs[0] - 4, center_abs[1] - 4)))
                 if mouse_on_canvas:
                     dx = mouse_pos_abs[0] - center_abs[0]
                     dy = mouse_pos_abs[1] - center_abs[1]
-                    radius = int(math.sqrt(dx*dx + dy*dy))
-                    if radius > 0:
-                        pygame.draw.circle(self.screen, config.LIGHT_GRAY, center_abs, radius, 1)
-
-        pygame.display.flip()
+                    # pygame.draw.circle draws nothing for a zero radius.
+                    radius = math.isqrt(dx*dx + dy*dy)
+                    preview_rects.append(pygame.draw.circle(screen, light_gray, center_abs, radius, 1))
+
+        # Only what was drawn on the canvas, a redrawn control panel, a new
+        # status line and this frame's and last frame's previews change.
+        dirty_rects = canvas_dirty_rects
+        if controls_changed:
+            dirty_rects.append(self.controls.rect)
+        status_key = (self.is_typing_prompt, status_text)
+        if status_key != self._drawn_status_key:
+            dirty_rects.append(status_area_rect)
+            self._drawn_status_key = status_key
+        dirty_rects += preview_rects
+        dirty_rects += self._last_preview_rects
+        self._last_preview_rects = preview_rects
+        if self._full_redraw:
+            pygame.display.flip()
+            self._full_redraw = False
+        elif dirty_rects:
+            pygame.display.update(dirty_rects)
 
     def _update(self, dt: float) -> None:
         """
         Update application state each frame.
 
-        Currently this function performs no specific actions, but is present
-        for future expansions (e.g. animations, game logic).
+        Paints any raster jobs that finished since the last frame.
 
         Args:
             dt: Delta time, elapsed time since last frame in seconds
         """
-        pass
+        self._paint_raster_jobs()
 
     def run(self) -> None:
         """
@@ -704,45 +1193,51 @@ class Application:
 
         The loop continues while `self.is_running` is True. In each iteration,
         controls framerate, handles events, updates state and renders screen.
+        While nothing changes (see `_is_idle`) the loop sleeps in
+        `_wait_for_input` instead of polling at the frame rate.
         """
-        while self.is_running:
-            dt: float = self.clock.tick(config.FPS) / 1000.0
-            self._handle_events()
-            self._update(dt)
-            self._render()
-
-        print("Exiting application...")
+        try:
+            while self.is_running:
+                dt: float = self.clock.tick(config.FPS) / 1000.0
+                if self._is_idle():
+                    self._wait_for_input()
+                    if self._is_idle():
+                        continue
+                self._sample_mouse()
+                self._handle_events()
+                self._update(dt)
+                self._render()
+        finally:
+            # Stop the raster worker explicitly: a Numba parallel region last
+            # entered from a thread still alive at interpreter exit can hang
+            # the TBB threading layer's shutdown.
+            self._raster_executor.shutdown(wait=True)
+            # A request in flight cannot be interrupted; its result is dropped.
+            self._gemini_executor.shutdown(wait=False, cancel_futures=True)
+            self._veo_executor.shutdown(wait=False, cancel_futures=True)
+
+        logger.debug("Exiting application...")
     
-    def _call_gemini_api(self, image_input: PILImage.Image, prompt_text: str) -> None:
+    def _run_gemini_job(self, image_input: PILImage.Image, prompt_text: str) -> None:
         """
         Call Gemini API with canvas image and user prompt.
-        
-        Processes response to get generated image and/or text.
-        If an image is received, replaces canvas content with it.
-        Updates self.gemini_status_message.
+
+        Runs on the Gemini worker thread. Processes the response to get a
+        generated image and/or text, and posts a `GEMINI_DONE_EVENT` carrying
+        the canvas-sized image surface (or None) and the status message; the
+        main thread applies it in `_apply_gemini_result`.
 
         Args:
             image_input: PIL image from canvas
             prompt_text: User's prompt text
         """
-        if not self.gemini_client:
-            self.gemini_status_message = "Error: Gemini client not initialized."
-            print(self.gemini_status_message)
-            return
-        
-        if not PILImage:
-             self.gemini_status_message = config.GEMINI_STATUS_ERROR_LIB
-             print(f"Error: {self.gemini_status_message}")
-             return
-
-        self.gemini_status_message = config.GEMINI_STATUS_LOADING
-        print(f"Calling Gemini API with original prompt: '{prompt_text}' and input image.")
-        self._render()
-        pygame.time.wait(10)
+        result_surface: Optional[pygame.Surface] = None
+        status = config.GEMINI_STATUS_LOADING
+        logger.debug("Calling Gemini API with original prompt: '%s' and input image.", prompt_text)
 
         try:
             enhanced_prompt_text = f"{prompt_text}. Keep the same minimal line doodle style."
-            print(f"Enhanced prompt sent to Gemini: '{enhanced_prompt_text}'")
+            logger.debug("Enhanced prompt sent to Gemini: '%s'", enhanced_prompt_text)
 
             contents = [ 
                 enhanced_prompt_text,
@@ -753,13 +1248,13 @@ class Application:
                 "response_modalities": ['TEXT', 'IMAGE'], 
                 "candidate_count": 1 
             }
-            print(f"Using generation_config: {generation_config_dict}")
+            logger.debug("Using generation_config: %s", generation_config_dict)
 
             generation_config = types.GenerateContentConfig(
                 response_modalities=['TEXT', 'IMAGE'],
                 candidate_count=1
             )
-            print(f"Using generation_config: {generation_config}")
+            logger.debug("Using generation_config: %s", generation_config)
 
             response = self.gemini_client.models.generate_content(
                 model=config.GEMINI_MODEL_NAME,
@@ -777,118 +1272,172 @@ class Application:
                     
                     elif hasattr(part, 'inline_data') and part.inline_data and part.inline_data.mime_type.startswith('image/'):
                         try:
-                            print(f"Received image part with mime_type: {part.inline_data.mime_type}")
+                            logger.debug("Received image part with mime_type: %s", part.inline_data.mime_type)
                             image_data_bytes = part.inline_data.data
-                            
-                            generated_pil_image = PILImage.open(io.BytesIO(image_data_bytes))
-                            
-                            temp_pygame_surface = None
-                            mode = generated_pil_image.mode
-                            size = generated_pil_image.size
-                            data_str = generated_pil_image.tobytes()
-                            
-                            if mode in ('RGB', 'RGBA'):
-                                temp_pygame_surface = pygame.image.fromstring(data_str, size, mode)
-                            else: 
-                                print(f"Image mode not directly supported: {mode}. Trying to convert to RGBA.")
-                                try:
-                                     generated_pil_image_converted = generated_pil_image.convert('RGBA')
-                                     mode = generated_pil_image_converted.mode
-                                     size = generated_pil_image_converted.size
-                                     data_str = generated_pil_image_converted.tobytes()
-                                     temp_pygame_surface = pygame.image.fromstring(data_str, size, mode)
-                                except Exception as convert_err:
-                                     print(f"Error converting PIL image to RGBA: {convert_err}")
+                            temp_pygame_surface = _decode_image_bytes(image_data_bytes)
 
                             if temp_pygame_surface:
-                                print("Replacing canvas content with generated image.")
-                                canvas_w, canvas_h = self.canvas.rect.size
-                                
-                                try:
-                                    scaled_generated_surface = pygame.transform.smoothscale(temp_pygame_surface, (canvas_w, canvas_h))
-                                except ValueError:
-                                    print("Warning: Could not smooth scale, using normal scale.")
-                                    scaled_generated_surface = pygame.transform.scale(temp_pygame_surface, (canvas_w, canvas_h))
-
-                                self.canvas.clear() 
-                                self.canvas.surface.blit(scaled_generated_surface, (0, 0)) 
-
-                                print("Canvas updated with generated image.")
+                                result_surface = self._scale_to_canvas(temp_pygame_surface)
+                                logger.debug("Generated image scaled to canvas size.")
                                 image_processed_and_applied = True 
                         
                         except Exception as img_proc_err:
-                            self.gemini_status_message = f"Error processing Gemini image: {str(img_proc_err)[:100]}"
-                            print(f"Error: {self.gemini_status_message}")
+                            status = f"Error processing Gemini image: {str(img_proc_err)[:100]}"
+                            logger.error("%s", status)
             
             if image_processed_and_applied:
-                self.gemini_status_message = "Canvas updated with AI!"
+                status = "Canvas updated with AI!"
                 if generated_text_response:
-                     self.gemini_status_message += " (and text received)"
-                     print(f"Additional text from Gemini:\n{generated_text_response.strip()}")
+                     status += " (and text received)"
+                     logger.debug("Additional text from Gemini:\n%s", generated_text_response.strip())
             elif generated_text_response:
-                 self.gemini_status_message = f"AI responded with text: {generated_text_response.strip()[:100]}..."
-                 print(f"Text-only response from Gemini:\n{generated_text_response.strip()}")
+                 status = f"AI responded with text: {generated_text_response.strip()[:100]}..."
+                 logger.debug("Text-only response from Gemini:\n%s", generated_text_response.strip())
             else:
                 block_reason = ""
                 block_message = ""
                 if hasattr(response, 'prompt_feedback') and response.prompt_feedback and response.prompt_feedback.block_reason:
                      block_reason = f" Reason: {response.prompt_feedback.block_reason}"
                      block_message = f" Msg: {response.prompt_feedback.block_reason_message}" if response.prompt_feedback.block_reason_message else ""
-                     self.gemini_status_message = f"Error: AI response blocked.{block_reason}{block_message}"
+                     status = f"Error: AI response blocked.{block_reason}{block_message}"
                 else:
-                     self.gemini_status_message = "Error: Empty or unexpected AI response."
-                print(self.gemini_status_message)
+                     status = "Error: Empty or unexpected AI response."
+                logger.debug("%s", status)
 
         except Exception as e:
-            self.gemini_status_message = f"Error in AI call: {type(e).__name__}"
-            print(f"Critical error during Gemini API call: {self.gemini_status_message}")
-            traceback.print_exc()
+            status = f"Error in AI call: {type(e).__name__}"
+            logger.exception("Critical error during Gemini API call: %s", status)
+
+        pygame.event.post(pygame.event.Event(self.GEMINI_DONE_EVENT,
+                                             {"surface": result_surface, "status": status}))
+
+    def _scale_to_canvas(self, surface: pygame.Surface) -> pygame.Surface:
+        """
+        Scale a generated image to the canvas size into a reusable surface.
+
+        One destination surface is kept per pixel format, since smoothscale
+        requires the destination to match the source. Reusing it is safe
+        because `_gemini_executor` has a single worker, so only one job
+        writes the buffers at a time. The main thread reads the result only
+        in `_apply_gemini_result`, and the returned surface must not be kept
+        beyond that.
+
+        Args:
+            surface: Decoded image of any size
+
+        Returns:
+            Canvas-sized surface holding the scaled image
+        """
+        size = self.canvas.rect.size
+        key = (surface.get_bitsize(), surface.get_masks())
+        dest = self._ai_scale_bufs.get(key)
+        if dest is None:
+            dest = pygame.Surface(size, surface.get_flags() & pygame.SRCALPHA,
+                                  surface.get_bitsize(), surface.get_masks())
+            self._ai_scale_bufs[key] = dest
+
+        try:
+            pygame.transform.smoothscale(surface, size, dest)
+        except ValueError:
+            logger.warning("Could not smooth scale, using normal scale.")
+            pygame.transform.scale(surface, size, dest)
+        return dest
+
+    def _apply_gemini_result(self, event: pygame.event.Event) -> None:
+        """
+        Apply a finished Gemini job on the main thread.
+
+        Args:
+            event: `GEMINI_DONE_EVENT` posted by `_run_gemini_job`
+        """
+        self._gemini_job = None
+        if event.surface is not None:
+            logger.debug("Replacing canvas content with generated image.")
+            self._paint_raster_jobs(wait=True)
+            self.canvas.clear()
+            self.canvas.mark_dirty(self.canvas.surface.blit(event.surface, (0, 0)))
+            logger.debug("Canvas updated with generated image.")
+        self.gemini_status_message = event.status
 
     def _start_veo_generation(self) -> None:
         """
         Start video generation with Veo, ALWAYS using current canvas image
         and a FIXED PROMPT to animate it while maintaining style.
         """
-        print("Veo - Starting _start_veo_generation (with canvas image and fixed prompt)...")
+        logger.debug("Veo - Starting _start_veo_generation (with canvas image and fixed prompt)...")
 
         if not self.gemini_client:
             self.gemini_status_message = config.VEO_STATUS_ERROR_API
-            print("Veo - Error: Gemini client (needed for Veo) not initialized.")
+            logger.error("Veo - Error: Gemini client (needed for Veo) not initialized.")
             return
 
         if self.is_veo_processing:
             self.gemini_status_message = config.VEO_STATUS_PROCESSING_ANOTHER_OP
-            print(f"Veo - {self.gemini_status_message} (Veo already processing).")
+            logger.debug("Veo - %s (Veo already processing).", self.gemini_status_message)
             return
         if self.is_typing_prompt:
             self.gemini_status_message = config.VEO_STATUS_PROCESSING_ANOTHER_OP
-            print(f"Veo - {self.gemini_status_message} (Gemini prompt writing mode active).")
+            logger.debug("Veo - %s (Gemini prompt writing mode active).", self.gemini_status_message)
             return
 
         pil_image: Optional[PILImage.Image] = self._capture_canvas_as_pil_image()
 
         if not pil_image:
             self.gemini_status_message = "Veo - Error: No image on canvas to animate."
-            print(self.gemini_status_message)
+            logger.debug("%s", self.gemini_status_message)
             return
 
-        print(f"Veo - Captured PIL image properties (original): Mode={pil_image.mode}, Size={pil_image.size}")
-        try:
-            debug_image_filename_png = "debug_veo_input_original.png"
-            pil_image.save(debug_image_filename_png)
-            print(f"Veo - Original image (PNG) for Veo saved as: {debug_image_filename_png}")
-        except Exception as e_save_png:
-            print(f"Veo - Error saving original debug image (PNG): {e_save_png}")
+        logger.debug("Veo - Captured PIL image properties (original): Mode=%s, Size=%s", pil_image.mode, pil_image.size)
+        if config.DEBUG_VEO_DUMPS:
+            try:
+                debug_image_filename_png = "debug_veo_input_original.png"
+                pil_image.save(debug_image_filename_png)
+                logger.debug("Veo - Original image (PNG) for Veo saved as: %s", debug_image_filename_png)
+            except Exception as e_save_png:
+                logger.error("Veo - Error saving original debug image (PNG): %s", e_save_png)
 
         fixed_veo_prompt = "animate keep the style Keep the same minimal line doodle style."
-        print(f"Veo - Using fixed prompt for Veo: '{fixed_veo_prompt}'")
+        logger.debug("Veo - Using fixed prompt for Veo: '%s'", fixed_veo_prompt)
 
         self.is_veo_processing = True
+        self._veo_session += 1
+        self.current_veo_operation_object = None
         self.gemini_status_message = config.VEO_STATUS_STARTING
-        print(f"Veo - Status updated to: {self.gemini_status_message}")
-        self._render() 
-        pygame.time.wait(10)
+        logger.debug("Veo - Status updated to: %s", self.gemini_status_message)
+        self._veo_job = self._veo_executor.submit(
+            self._run_veo_start, pil_image, fixed_veo_prompt, self._veo_session,
+            self.canvas.revision
+        )
+
+    def _post_veo_result(self, session: int, operation: Optional[Any], status: str) -> None:
+        """
+        Report the outcome of a Veo worker job to the main thread.
+
+        Args:
+            session: Veo session the job belongs to
+            operation: Operation still running, or None if Veo is finished
+            status: Status message to show
+        """
+        pygame.event.post(pygame.event.Event(self.VEO_DONE_EVENT, {
+            "session": session, "operation": operation, "status": status
+        }))
 
+    def _run_veo_start(self, pil_image: PILImage.Image, prompt_text: str, session: int,
+                       canvas_revision: int) -> None:
+        """
+        Encode the canvas image and start a Veo video generation.
+
+        Runs on the Veo worker thread and posts a `VEO_DONE_EVENT` carrying the
+        started operation, or None and an error status. The encoded image is
+        kept per canvas revision, so retrying on an unchanged canvas skips
+        the PNG encode.
+
+        Args:
+            pil_image: PIL image from canvas
+            prompt_text: Prompt sent along with the image
+            session: Veo session the job belongs to
+            canvas_revision: `Canvas.revision` the image was captured at
+        """
         try:
             veo_config = types.GenerateVideosConfig(
                 aspect_ratio=config.VEO_DEFAULT_ASPECT_RATIO,
@@ -896,140 +1445,213 @@ class Application:
                 person_generation=config.VEO_DEFAULT_PERSON_GENERATION,
                 number_of_videos=1
             )
-            print(f"Veo - Configuration for generate_videos: {veo_config}")
+            logger.debug("Veo - Configuration for generate_videos: %s", veo_config)
 
             image_input_for_api = None
-            print("Veo - Processing captured image to send as types.Image (PNG)...")
-            try:
-                image_bytes_io = io.BytesIO()
-                pil_image.save(image_bytes_io, format="PNG") 
-                image_bytes = image_bytes_io.getvalue()
-                current_mime_type = "image/png"
-                print(f"Veo - PNG bytes generated, size: {len(image_bytes)} bytes.")
+            cached_image = self._veo_image_cache
+            if cached_image is not None and cached_image[0] == canvas_revision:
+                image_input_for_api = cached_image[1]
+                logger.debug("Veo - Canvas unchanged since last request. Reusing encoded image.")
+            else:
+                logger.debug("Veo - Processing captured image to send as types.Image (PNG)...")
+                try:
+                    image_bytes_io = io.BytesIO()
+                    pil_image.save(image_bytes_io, format="PNG", compress_level=config.VEO_PNG_COMPRESS_LEVEL) 
+                    image_bytes = image_bytes_io.getvalue()
+                    current_mime_type = "image/png"
+                    logger.debug("Veo - PNG bytes generated, size: %s bytes.", len(image_bytes))
                 
-                image_input_for_api = types.Image(image_bytes=image_bytes, mime_type=current_mime_type)
-                print(f"Veo - Image successfully converted to types.Image (mime_type: {current_mime_type}).")
-
-            except Exception as e_convert:
-                print(f"Veo - CRITICAL: Error building types.Image: {e_convert}")
-                traceback.print_exc()
-                self.gemini_status_message = f"Error preparing image for Veo: {str(e_convert)[:100]}"
-                self.is_veo_processing = False
-                return
+                    image_input_for_api = types.Image(image_bytes=image_bytes, mime_type=current_mime_type)
+                    logger.debug("Veo - Image successfully converted to types.Image (mime_type: %s).", current_mime_type)
+                    self._veo_image_cache = (canvas_revision, image_input_for_api)
+
+                except Exception as e_convert:
+                    logger.exception("Veo - CRITICAL: Error building types.Image: %s", e_convert)
+                    self._post_veo_result(session, None, f"Error preparing image for Veo: {str(e_convert)[:100]}")
+                    return
             
-            print(f"Veo - Starting generate_videos call with prompt: '{fixed_veo_prompt}' and with image (types.Image).")
+            logger.debug("Veo - Starting generate_videos call with prompt: '%s' and with image (types.Image).", prompt_text)
             
             operation = self.gemini_client.models.generate_videos(
                 model=config.VEO_MODEL_NAME,
-                prompt=fixed_veo_prompt,
+                prompt=prompt_text,
                 image=image_input_for_api,
                 config=veo_config,
             )
             
-            self.current_veo_operation_object = operation 
-            if self.current_veo_operation_object and hasattr(self.current_veo_operation_object, 'name'):
-                self.veo_operation_name_for_log = self.current_veo_operation_object.name 
-                self.gemini_status_message = config.VEO_STATUS_GENERATING
-                print(f"Veo - Veo operation started. Name: {self.veo_operation_name_for_log}. Status: {self.gemini_status_message}")
-                pygame.time.set_timer(self.VEO_POLLING_EVENT, config.VEO_INITIAL_POLL_DELAY_MS, loops=1)
-                print(f"Veo - Polling scheduled in {config.VEO_INITIAL_POLL_DELAY_MS / 1000} seconds.")
+            if operation and hasattr(operation, 'name'):
+                logger.debug("Veo - Veo operation started. Name: %s.", operation.name)
+                self._post_veo_result(session, operation, config.VEO_STATUS_GENERATING)
             else:
-                self.gemini_status_message = "Error: generate_videos did not return valid operation object."
-                print(f"Veo - {self.gemini_status_message}")
-                self.is_veo_processing = False
-                self.current_veo_operation_object = None
+                status = "Error: generate_videos did not return valid operation object."
+                logger.debug("Veo - %s", status)
+                self._post_veo_result(session, None, status)
 
         except Exception as e: 
-            self.gemini_status_message = f"Critical error starting Veo: {type(e).__name__}"
-            print(f"Veo - {self.gemini_status_message}: {e}")
-            traceback.print_exc()
-            self.is_veo_processing = False 
-            self.current_veo_operation_object = None
+            status = f"Critical error starting Veo: {type(e).__name__}"
+            logger.exception("Veo - %s: %s", status, e)
+            self._post_veo_result(session, None, status)
             
     def _poll_veo_status(self) -> None:
-        """Query the status of an ongoing Veo operation."""
+        """Submit a status query for the ongoing Veo operation to the Veo worker."""
         
         if not self.current_veo_operation_object or not self.is_veo_processing or not self.gemini_client:
-            print("Veo - Poll: No active Veo operation or client not available. Stopping polling.")
+            logger.debug("Veo - Poll: No active Veo operation or client not available. Stopping polling.")
             pygame.time.set_timer(self.VEO_POLLING_EVENT, 0)
             self.is_veo_processing = False
             self.current_veo_operation_object = None
             return
 
-        current_op_name_for_log = getattr(self.current_veo_operation_object, 'name', 'UNKNOWN_ID')
-        
-        print(f"Veo - Poll: Querying status of operation: {current_op_name_for_log}")
+        if self._veo_job is not None:
+            logger.debug("Veo - Poll: Previous query still running. Skipping this one.")
+            return
+
+        logger.debug("Veo - Poll: Querying status of operation: %s",
+                     getattr(self.current_veo_operation_object, 'name', 'UNKNOWN_ID'))
         self.gemini_status_message = config.VEO_STATUS_POLLING
-        self._render()
+        self._veo_job = self._veo_executor.submit(
+            self._run_veo_poll, self.current_veo_operation_object, self._veo_session
+        )
+
+    def _run_veo_poll(self, operation: Any, session: int) -> None:
+        """
+        Query a Veo operation and save its videos once it is done.
+
+        Runs on the Veo worker thread, so downloads and file writes never
+        block the main loop. Posts a `VEO_DONE_EVENT` carrying the refreshed
+        operation while it is still running, or None once it has finished.
+
+        Args:
+            operation: Veo operation to query
+            session: Veo session the job belongs to
+        """
+        current_op_name_for_log = getattr(operation, 'name', 'UNKNOWN_ID')
 
         try:
-            self.current_veo_operation_object = self.gemini_client.operations.get(self.current_veo_operation_object)
-            print(f"Veo - Poll: Response from operations.get() received for {current_op_name_for_log}.")
+            operation = self.gemini_client.operations.get(operation)
+            logger.debug("Veo - Poll: Response from operations.get() received for %s.", current_op_name_for_log)
 
-            if self.current_veo_operation_object.done:
-                print(f"Veo - Poll: Operation {current_op_name_for_log} marked as 'done'.")
-                pygame.time.set_timer(self.VEO_POLLING_EVENT, 0)
-                self.is_veo_processing = False
-                
-                operation_final_result = self.current_veo_operation_object
-                self.current_veo_operation_object = None
-
-                if hasattr(operation_final_result, 'error') and operation_final_result.error:
-                    error_code = getattr(operation_final_result.error, 'code', 'N/A')
-                    error_message = getattr(operation_final_result.error, 'message', 'Unknown error in Veo.')
-                    self.gemini_status_message = f"Error in Veo (Code: {error_code}): {error_message}"
-                    print(f"Veo - Poll: {self.gemini_status_message}")
-                
-                elif operation_final_result.response and hasattr(operation_final_result.response, 'generated_videos'):
-                    generated_videos = operation_final_result.response.generated_videos
-                    if generated_videos:
-                        print(f"Veo - Poll: {len(generated_videos)} video(s) generated.")
-                        saved_count = 0
-                        for i, gen_video_metadata in enumerate(generated_videos):
-                            video_metadata_name = getattr(gen_video_metadata.video, 'name', f'unnamed_video_{i}')
-                            try:
-                                timestamp = pygame.time.get_ticks()
-                                video_filename = f"veo_video_{timestamp}_{i}.mp4"
-                                print(f"Veo - Poll: Processing video {i+1} (ID from API: {video_metadata_name})...")
-
-                                print(f"Veo - Poll: Calling client.files.download for {video_metadata_name}...")
-                                video_bytes = self.gemini_client.files.download(file=gen_video_metadata.video) 
-
-                                if video_bytes and isinstance(video_bytes, bytes):
-                                    print(f"Veo - Poll: Download completed for {video_metadata_name}. Received {len(video_bytes)} bytes.")
-                                    print(f"Veo - Poll: Attempting to save {video_filename}...")
-                                    with open(video_filename, "wb") as f:
-                                        f.write(video_bytes)
-                                    print(f"Veo - Poll: Video {video_filename} saved successfully.")
+            if not operation.done:
+                logger.debug("Veo - Poll: Operation %s still processing.", current_op_name_for_log)
+                self._post_veo_result(session, operation, config.VEO_STATUS_GENERATING)
+                return
+
+            logger.debug("Veo - Poll: Operation %s marked as 'done'.", current_op_name_for_log)
+            operation_final_result = operation
+
+            if hasattr(operation_final_result, 'error') and operation_final_result.error:
+                error_code = getattr(operation_final_result.error, 'code', 'N/A')
+                error_message = getattr(operation_final_result.error, 'message', 'Unknown error in Veo.')
+                status = f"Error in Veo (Code: {error_code}): {error_message}"
+                logger.debug("Veo - Poll: %s", status)
+            
+            elif operation_final_result.response and hasattr(operation_final_result.response, 'generated_videos'):
+                generated_videos = operation_final_result.response.generated_videos
+                if generated_videos:
+                    logger.debug("Veo - Poll: %s video(s) generated.", len(generated_videos))
+                    saved_count = 0
+                    for i, gen_video_metadata in enumerate(generated_videos):
+                        video_metadata_name = getattr(gen_video_metadata.video, 'name', f'unnamed_video_{i}')
+                        try:
+                            timestamp = pygame.time.get_ticks()
+                            video_filename = f"veo_video_{timestamp}_{i}.mp4"
+                            logger.debug("Veo - Poll: Processing video %s (ID from API: %s)...", i+1, video_metadata_name)
+
+                            logger.debug("Veo - Poll: Calling client.files.download for %s...", video_metadata_name)
+                            if self._veo_stream_downloads:
+                                # Chunks go straight to disk instead of being
+                                # held in memory. They are written under a
+                                # temporary name, so a failed or empty download
+                                # never looks like a saved video.
+                                video_path = Path(video_filename)
+                                part_path = Path(video_filename + ".part")
+                                try:
+                                    with part_path.open("wb") as f:
+                                        self.gemini_client.files.download(
+                                            file=gen_video_metadata.video,
+                                            destination=f,
+                                        )
+                                    if part_path.stat().st_size:
+                                        part_path.replace(video_path)
+                                finally:
+                                    part_path.unlink(missing_ok=True)
+
+                                if video_path.exists():
+                                    logger.info(
+                                        "Veo - Poll: Video %s saved (%s bytes).",
+                                        video_filename, video_path.stat().st_size,
+                                    )
                                     saved_count += 1
                                 else:
-                                    print(f"Veo - Poll: Download for {video_metadata_name} did not return valid bytes. Type received: {type(video_bytes)}")
+                                    logger.warning(
+                                        "Veo - Poll: Download for %s wrote no data.",
+                                        video_metadata_name,
+                                    )
+                                continue
+
+                            video_bytes = self.gemini_client.files.download(file=gen_video_metadata.video) 
+
+                            if video_bytes and isinstance(video_bytes, bytes):
+                                logger.debug("Veo - Poll: Download completed for %s. Received %s bytes.", video_metadata_name, len(video_bytes))
+                                logger.debug("Veo - Poll: Attempting to save %s...", video_filename)
+                                with open(video_filename, "wb") as f:
+                                    f.write(video_bytes)
+                                logger.info("Veo - Poll: Video %s saved successfully.", video_filename)
+                                saved_count += 1
+                            else:
+                                logger.warning("Veo - Poll: Download for %s did not return valid bytes. Type received: %s", video_metadata_name, type(video_bytes))
 
-                            except Exception as save_err:
-                                print(f"Veo - Poll: Error downloading/saving video {i+1} ({video_filename}): {type(save_err).__name__} - {save_err}")
-                                traceback.print_exc()
-                        
-                        if saved_count > 0:
-                            self.gemini_status_message = config.VEO_STATUS_SUCCESS
-                        else:
-                            self.gemini_status_message = "Veo finished, but could not save videos."
-                        print(f"Veo - Poll: Final save status: {self.gemini_status_message}")
+                        except Exception as save_err:
+                            logger.exception("Veo - Poll: Error downloading/saving video %s (%s): %s - %s", i+1, video_filename, type(save_err).__name__, save_err)
+                    
+                    if saved_count > 0:
+                        status = config.VEO_STATUS_SUCCESS
                     else:
-                        self.gemini_status_message = "Veo finished, but no videos were generated in response."
-                        print(f"Veo - Poll: {self.gemini_status_message}")
+                        status = "Veo finished, but could not save videos."
+                    logger.debug("Veo - Poll: Final save status: %s", status)
                 else:
-                    self.gemini_status_message = "Veo completed operation unexpectedly (no error or valid videos)."
-                    print(f"Veo - Poll: {self.gemini_status_message}")
+                    status = "Veo finished, but no videos were generated in response."
+                    logger.debug("Veo - Poll: %s", status)
             else:
-                pygame.time.set_timer(self.VEO_POLLING_EVENT, config.VEO_POLLING_INTERVAL_MS, loops=1)
-                print(f"Veo - Poll: Operation {current_op_name_for_log} still processing. Next query in {config.VEO_POLLING_INTERVAL_MS / 1000}s.")
-                self.gemini_status_message = config.VEO_STATUS_GENERATING
+                status = "Veo completed operation unexpectedly (no error or valid videos)."
+                logger.debug("Veo - Poll: %s", status)
 
         except Exception as e:
-            self.gemini_status_message = f"Critical error querying Veo status: {type(e).__name__}"
-            current_op_name_for_log_exc = getattr(self.current_veo_operation_object, 'name', 'UNKNOWN_ID_IN_EXCEPTION')
-            print(f"Veo - Poll: {self.gemini_status_message} for {current_op_name_for_log_exc}: {e}")
-            traceback.print_exc()
+            status = f"Critical error querying Veo status: {type(e).__name__}"
+            logger.exception("Veo - Poll: %s for %s: %s", status, current_op_name_for_log, e)
+
+        self._post_veo_result(session, None, status)
+
+    def _apply_veo_result(self, event: pygame.event.Event) -> None:
+        """
+        Apply the outcome of a Veo worker job on the main thread.
+
+        Results of a session that was cancelled or replaced are dropped. While
+        the operation is still running the next poll is scheduled, starting at
+        `config.VEO_INITIAL_POLL_DELAY_MS` and then backing off exponentially.
+
+        Args:
+            event: `VEO_DONE_EVENT` posted by `_run_veo_start` or `_run_veo_poll`
+        """
+        if event.session != self._veo_session:
+            return
+        self._veo_job = None
+        if not self.is_veo_processing:
+            return
+
+        self.gemini_status_message = event.status
+        if event.operation is None:
             pygame.time.set_timer(self.VEO_POLLING_EVENT, 0)
             self.is_veo_processing = False
-            self.current_veo_operation_object = None
\ No newline at end of file
+            self.current_veo_operation_object = None
+            return
+
+        if self.current_veo_operation_object is None:
+            delay_ms = config.VEO_INITIAL_POLL_DELAY_MS
+            self._veo_poll_interval_ms = config.VEO_POLLING_INTERVAL_MS
+        else:
+            delay_ms = self._veo_poll_interval_ms
+            self._veo_poll_interval_ms = min(2 * delay_ms, config.VEO_MAX_POLLING_INTERVAL_MS)
+        self.current_veo_operation_object = event.operation
+        pygame.time.set_timer(self.VEO_POLLING_EVENT, delay_ms, loops=1)
+        logger.debug("Veo - Next status query in %ss.", delay_ms / 1000)
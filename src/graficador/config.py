@@ -46,9 +46,18 @@ WINDOW_BG_COLOR: pygame.Color = pygame.Color(200, 200, 200)
 # Game settings
 WINDOW_TITLE: str = "Interactive Geometric Plotter"
 FPS: int = 60
+# Longest time the main loop sleeps waiting for input while nothing changes
+IDLE_WAIT_TIMEOUT_MS: int = 100
 
 # Drawing settings
 POLYGON_CLOSE_THRESHOLD: int = 10
+POLYGON_CLOSE_THRESHOLD_SQ: int = POLYGON_CLOSE_THRESHOLD * POLYGON_CLOSE_THRESHOLD
+# Lines whose average horizontal/vertical run is at least this long are
+# painted as rectangle fills per run instead of pixel by pixel
+LINE_RUN_MIN_LENGTH: int = 8
+# Triangle and polygon edges are drawn with SDL's line primitive; set to True
+# to rasterize them with the educational Bresenham implementation instead
+BRESENHAM_EDGES: bool = False
 
 # Available colors for UI selection
 AVAILABLE_COLORS: Dict[str, pygame.Color] = {
@@ -74,10 +83,16 @@ GEMINI_STATUS_ERROR_GENERAL: str = "AI error. Try again."
 # Veo configuration
 VEO_BUTTON_TEXT: str = "Video with Veo (V)"
 VEO_MODEL_NAME: str = "veo-2.0-generate-001"
+# zlib level for the PNG sent to Veo (1 = fastest, 9 = smallest)
+VEO_PNG_COMPRESS_LEVEL: int = 1
+# Save the image sent to Veo as debug_veo_input_original.png
+DEBUG_VEO_DUMPS: bool = False
 
 # Veo polling times (in milliseconds)
 VEO_INITIAL_POLL_DELAY_MS: int = 10000
 VEO_POLLING_INTERVAL_MS: int = 15000
+# Each unfinished poll doubles the interval up to this cap
+VEO_MAX_POLLING_INTERVAL_MS: int = 30000
 
 # Veo status messages
 VEO_STATUS_STARTING: str = "Starting video generation with Veo..."
@@ -0,0 +1,27 @@
+# src/graficador/geometry/clipping.py
+"""
+Clipping geometry module.
+
+This module implements bounding box tests against a rectangular viewport, so
+primitives that cannot light any visible pixel are skipped before they are
+rasterized. Partly visible primitives are rasterized whole and cropped pixel
+by pixel by the canvas.
+"""
+
+def box_outside(x_min: int, y_min: int, x_max: int, y_max: int,
+                width: int, height: int) -> bool:
+    """
+    Check whether a bounding box lies entirely outside the viewport.
+
+    Args:
+        x_min: Left edge of the box (inclusive).
+        y_min: Top edge of the box (inclusive).
+        x_max: Right edge of the box (inclusive).
+        y_max: Bottom edge of the box (inclusive).
+        width: Viewport width in pixels.
+        height: Viewport height in pixels.
+
+    Returns:
+        True if no pixel of the box falls inside the viewport.
+    """
+    return x_max < 0 or y_max < 0 or x_min >= width or y_min >= height
@@ -0,0 +1,73 @@
+# src/graficador/geometry/point_buffer.py
+"""
+Point buffer geometry module.
+
+This module defines PointBuffer, a growable list of 2D integer points stored
+in a single NumPy array so whole point sets can be processed at once.
+"""
+from collections.abc import Iterator
+
+import numpy as np
+
+from .point import Point
+
+
+class PointBuffer:
+    """
+    Growable sequence of integer points backed by an (N, 2) int32 array.
+
+    Points are appended one at a time like a list, while `array` exposes the
+    stored points as a NumPy view for vectorized operations. Clearing only
+    resets the row count, so the storage is reused.
+
+    Attributes:
+        array (np.ndarray): View of shape (len, 2) over the stored points.
+    """
+
+    def __init__(self, capacity: int = 8):
+        """
+        Initialize an empty buffer.
+
+        Args:
+            capacity: Number of points to preallocate. Defaults to 8.
+        """
+        self._data: np.ndarray = np.empty((max(capacity, 1), 2), dtype=np.int32)
+        self._count: int = 0
+
+    @property
+    def array(self) -> np.ndarray:
+        """View of shape (len, 2) over the stored points."""
+        return self._data[:self._count]
+
+    def append(self, point: Point) -> None:
+        """
+        Add a point at the end of the buffer, growing the storage if full.
+
+        Args:
+            point: Point to append.
+        """
+        if self._count == len(self._data):
+            grown = np.empty((2 * len(self._data), 2), dtype=np.int32)
+            grown[:self._count] = self._data
+            self._data = grown
+        self._data[self._count] = point
+        self._count += 1
+
+    def clear(self) -> None:
+        """Remove all points, keeping the allocated storage."""
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> Point:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("PointBuffer index out of range")
+        x, y = self._data[index].tolist()
+        return Point(x, y)
+
+    def __iter__(self) -> Iterator[Point]:
+        for x, y in self.array.tolist():
+            yield Point(x, y)
@@ -1,44 +1,48 @@
 # src/graficador/main.py
+import logging
 import pygame
 from .app import Application
 from dotenv import load_dotenv
 import os
-import traceback
+
+logger = logging.getLogger(__name__)
 
 def main() -> None:
     """
     Initialize and run the main application.
     Loads environment variables from .env file at startup.
     """
+    logging.basicConfig(level=logging.WARNING,
+                        format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
     try:
         # Calculate project root path
         project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
         dotenv_path = os.path.join(project_root, '.env')
 
-        print(f"Looking for .env file in project root: {dotenv_path}")
+        logger.debug("Looking for .env file in project root: %s", dotenv_path)
 
         if os.path.exists(dotenv_path):
             loaded = load_dotenv(dotenv_path=dotenv_path, override=True) 
             if loaded:
-                print(f".env file loaded from project root: {dotenv_path}")
+                logger.debug(".env file loaded from project root: %s", dotenv_path)
             else:
-                 print(f"WARNING: Found {dotenv_path}, but there was a problem loading it (empty, permissions?).")
+                 logger.warning("Found %s, but there was a problem loading it (empty, permissions?).", dotenv_path)
         else:
-            print(f"WARNING: .env file NOT found in project root ({dotenv_path}). "
-                  "Make sure it exists and contains the GOOGLE_API_KEY variable.")
+            logger.warning(".env file NOT found in project root (%s). "
+                           "Make sure it exists and contains the GOOGLE_API_KEY variable.", dotenv_path)
 
     except Exception as e:
-        print(f"ERROR when trying to load .env file: {e}")
+        logger.error("ERROR when trying to load .env file: %s", e)
 
     try:
         app = Application()
         app.run()
     except Exception as e:
-        print(f"ERROR: An unexpected error occurred in the application: {e}")
-        traceback.print_exc()
+        logger.exception("An unexpected error occurred in the application: %s", e)
     finally:
         if pygame.get_init():
-            print("Closing Pygame...")
+            logger.debug("Closing Pygame...")
             pygame.quit()
 
 if __name__ == '__main__':
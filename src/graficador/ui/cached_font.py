@@ -0,0 +1,68 @@
+"""
+Cached font module.
+
+Defines the `CachedFont` class, a thin wrapper around `pygame.font.Font`
+that remembers rendered text surfaces so that labels drawn every frame
+are only shaped once.
+"""
+from collections import OrderedDict
+from typing import Any, Optional
+
+import pygame
+
+
+class CachedFont:
+    """
+    Font wrapper that memoizes `render` results in a small LRU cache.
+
+    Surfaces returned by `render` are shared between calls with the same
+    arguments, so callers must only blit them, never draw on them. Every
+    other attribute is forwarded to the wrapped font.
+
+    Attributes:
+        font (pygame.font.Font): Wrapped font used on cache misses.
+        max_entries (int): Maximum number of cached surfaces.
+    """
+
+    def __init__(self, font: pygame.font.Font, max_entries: int = 128):
+        """
+        Initialize the wrapper.
+
+        Args:
+            font: Font to render text with.
+            max_entries: Maximum number of cached surfaces. Defaults to 128.
+        """
+        self.font: pygame.font.Font = font
+        self.max_entries: int = max_entries
+        self._surfaces: OrderedDict[tuple[Any, ...], pygame.Surface] = OrderedDict()
+
+    def render(self, text: str, antialias: bool, color: pygame.Color,
+               background: Optional[pygame.Color] = None) -> pygame.Surface:
+        """
+        Render text, reusing the surface of an earlier identical call.
+
+        Args:
+            text: Text to render.
+            antialias: True to render with antialiased edges.
+            color: Text color.
+            background: Background color, or None for a transparent one.
+
+        Returns:
+            Surface with the rendered text.
+        """
+        # pygame.Color is unhashable, so colors are keyed as tuples.
+        key = (text, antialias, tuple(color),
+               tuple(background) if background is not None else None)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            return surface
+
+        surface = self.font.render(text, antialias, color, background)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.font, name)
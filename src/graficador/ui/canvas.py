@@ -6,16 +6,22 @@ Manages its own surface, background color, and provides methods for drawing pixe
 coordinate conversion.
 """
 
+import logging
+import numpy as np
 import pygame
-from typing import Tuple
+from typing import Dict, List, Sequence, Tuple, Union
 from ..geometry.point import Point
 from .. import config
 
+logger = logging.getLogger(__name__)
+
 class Canvas:
     """
     Interactive drawing area for the application.
 
-    Manages a separate Pygame surface where all drawing operations are performed.
+    Manages a separate, persistent Pygame surface where all drawing operations are
+    performed; shapes are rasterized into it once and the whole surface is blitted
+    to the screen each frame.
     Provides methods to clear the canvas, draw individual pixels, and convert coordinates
     between the canvas relative system and screen absolute coordinates.
 
@@ -23,6 +29,15 @@ class Canvas:
         rect (pygame.Rect): Rectangle defining canvas position and size within main window.
         surface (pygame.Surface): Pygame surface where drawing occurs.
         bg_color (pygame.Color): Current canvas background color.
+        revision (int): Counter bumped by every change to `surface`, so
+            results derived from the pixels can be cached per revision.
+
+    Every drawing method records the region it touched, and `take_dirty_rects`
+    hands those regions to the screen update. Code drawing on `surface`
+    directly must report the changed region with `mark_dirty`.
+
+    Drawing methods accept either a `pygame.Color` or a color already mapped to
+    the surface pixel format by `map_color`.
     """
 
     def __init__(self, x: int, y: int, width: int, height: int, bg_color: pygame.Color):
@@ -38,27 +53,140 @@ class Canvas:
         """
         self.rect: pygame.Rect = pygame.Rect(x, y, width, height)
         self.surface: pygame.Surface = pygame.Surface((width, height))
+        if pygame.display.get_surface() is not None:
+            # Match the display pixel format so blitting to the screen each
+            # frame is a plain copy with no per-pixel conversion.
+            self.surface = self.surface.convert()
         self.bg_color: pygame.Color = bg_color
+        self._mapped_colors: Dict[Tuple[int, int, int, int], int] = {}
+        self._dirty_rects: List[pygame.Rect] = []
+        self.revision: int = 0
         self.clear()
 
+    def mark_dirty(self, rect: pygame.Rect) -> None:
+        """
+        Record a changed region of the canvas surface.
+
+        Args:
+            rect: Changed region in canvas relative coordinates.
+        """
+        if rect.width and rect.height:
+            self._dirty_rects.append(rect)
+            self.revision += 1
+
+    def take_dirty_rects(self) -> List[pygame.Rect]:
+        """
+        Return the regions changed since the last call and forget them.
+
+        Returns:
+            Changed regions in absolute screen coordinates.
+        """
+        dirty_rects = [rect.move(self.rect.x, self.rect.y) for rect in self._dirty_rects]
+        self._dirty_rects.clear()
+        return dirty_rects
+
     def clear(self) -> None:
         """Clear the canvas by filling it with the background color."""
         self.surface.fill(self.bg_color)
+        self._dirty_rects = [self.surface.get_rect()]
+        self.revision += 1
+
+    def map_color(self, color: Union[pygame.Color, int]) -> int:
+        """
+        Map a color to the canvas surface pixel format.
 
-    def draw_pixel(self, x: int, y: int, color: pygame.Color) -> None:
+        Results are cached per RGBA value, so repeated draws in the same color
+        skip `pygame.Surface.map_rgb`.
+
+        Args:
+            color: Color to map. Integers are assumed to be already mapped.
+
+        Returns:
+            Packed integer pixel value for the canvas surface.
+        """
+        if isinstance(color, int):
+            return color
+        key = (color.r, color.g, color.b, color.a)
+        mapped = self._mapped_colors.get(key)
+        if mapped is None:
+            mapped = self.surface.map_rgb(color)
+            self._mapped_colors[key] = mapped
+        return mapped
+
+    def draw_pixel(self, x: int, y: int, color: Union[pygame.Color, int]) -> None:
         """
         Draw a pixel on the canvas at relative coordinates.
 
         Args:
             x: X coordinate relative to canvas.
             y: Y coordinate relative to canvas.
-            color: Pixel color to draw.
+            color: Pixel color to draw, or a color mapped by `map_color`.
         """
         if 0 <= x < self.rect.width and 0 <= y < self.rect.height:
             try:
-                self.surface.set_at((x, y), color)
+                self.surface.set_at((x, y), self.map_color(color))
+                self.mark_dirty(pygame.Rect(x, y, 1, 1))
             except IndexError:
-                print(f"Warning: Attempted to draw pixel outside canvas bounds at ({x}, {y})")
+                logger.warning("Attempted to draw pixel outside canvas bounds at (%d, %d)", x, y)
+
+    def put_pixels(self, xs: np.ndarray, ys: np.ndarray, color: Union[pygame.Color, int]) -> None:
+        """
+        Draw a batch of pixels on the canvas at relative coordinates.
+
+        Coordinates outside the canvas are discarded, and the remaining pixels
+        are written in a single operation through a `pygame.surfarray` view.
+
+        Args:
+            xs: Integer array of X coordinates relative to canvas.
+            ys: Integer array of Y coordinates relative to canvas, same length as xs.
+            color: Pixel color to draw, or a color mapped by `map_color`.
+        """
+        inside = (xs >= 0) & (xs < self.rect.width) & (ys >= 0) & (ys < self.rect.height)
+        xs = xs[inside]
+        ys = ys[inside]
+        if not len(xs):
+            return
+        pixels = pygame.surfarray.pixels2d(self.surface)
+        pixels[xs, ys] = self.map_color(color)
+        del pixels
+        x_min = int(xs.min())
+        y_min = int(ys.min())
+        self.mark_dirty(pygame.Rect(x_min, y_min, int(xs.max()) - x_min + 1,
+                                    int(ys.max()) - y_min + 1))
+
+    def fill_rects(self, rects: np.ndarray, color: Union[pygame.Color, int]) -> None:
+        """
+        Fill a batch of rectangles on the canvas at relative coordinates.
+
+        Rectangles are clipped to the canvas before filling, since
+        `pygame.Surface.fill` shifts a rectangle with a negative position onto
+        the surface instead of cropping it. The surface is locked once for
+        the whole batch rather than by each fill.
+
+        Args:
+            rects: Integer array of shape (N, 4) with (x, y, width, height) rows.
+            color: Fill color, or a color mapped by `map_color`.
+        """
+        corners = np.empty((len(rects), 4), dtype=np.int64)
+        corners[:, :2] = np.maximum(rects[:, :2], 0)
+        corners[:, 2:] = np.minimum(rects[:, :2] + rects[:, 2:], self.rect.size)
+        corners = corners[(corners[:, 2] > corners[:, 0]) & (corners[:, 3] > corners[:, 1])]
+        if not len(corners):
+            return
+        clipped = corners.copy()
+        clipped[:, 2:] -= corners[:, :2]
+
+        mapped_color = self.map_color(color)
+        fill = self.surface.fill
+        self.surface.lock()
+        try:
+            for rect in clipped.tolist():
+                fill(mapped_color, rect)
+        finally:
+            self.surface.unlock()
+        x_min, y_min = corners[:, :2].min(axis=0).tolist()
+        x_max, y_max = corners[:, 2:].max(axis=0).tolist()
+        self.mark_dirty(pygame.Rect(x_min, y_min, x_max - x_min, y_max - y_min))
 
     def render(self, target_surface: pygame.Surface) -> None:
         """
@@ -81,6 +209,20 @@ class Canvas:
         """
         return (point.x + self.rect.x, point.y + self.rect.y)
 
+    def to_absolute_bulk(self, points: Union[Sequence[Point], np.ndarray]) -> np.ndarray:
+        """
+        Convert many canvas-relative points to absolute screen coordinates.
+
+        Args:
+            points: Points relative to canvas, as a sequence of Points or an
+                    integer array of shape (N, 2).
+
+        Returns:
+            int32 array of shape (N, 2) with absolute coordinates in the main window.
+        """
+        relative = np.asarray(points, dtype=np.int32).reshape(-1, 2)
+        return relative + np.array([self.rect.x, self.rect.y], dtype=np.int32)
+
     def to_relative_pos(self, point: Point) -> Point:
         """
         Convert absolute screen coordinates to canvas-relative coordinates.
@@ -5,10 +5,13 @@ Defines the Controls class that represents the control panel where users can sel
 tools, colors, and other application options.
 """
 
+import logging
 import pygame
 from .. import config
 from .button import Button
 
+logger = logging.getLogger(__name__)
+
 class Controls:
     """
     Application control panel interface.
@@ -24,6 +27,7 @@ class Controls:
         font_small (pygame.font.Font): Small font for color buttons.
         buttons (list[Button]): List of tool buttons.
         color_buttons (list[Button]): List of color selection buttons.
+        dirty (bool): True if `surface` must be redrawn before the next blit.
     """
 
     def __init__(self, x: int, y: int, width: int, height: int, 
@@ -56,6 +60,9 @@ class Controls:
         self._create_tool_buttons()
         self._create_color_buttons()
 
+        self.dirty: bool = True
+        self._drawn_selection: tuple[str, tuple[int, ...]] | None = None
+
     def _create_tool_buttons(self):
         """Create and configure tool selection buttons."""
         button_width = self.rect.width - 40
@@ -136,11 +143,15 @@ class Controls:
         
         if mouse_pos_relative:
             for button in all_buttons:
+                was_hovered = button.is_hovered
                 button.check_hover(mouse_pos_relative)
+                if button.is_hovered != was_hovered:
+                    self.dirty = True
         else:
             for button in all_buttons:
                 if button.is_hovered:
                     button.is_hovered = False
+                    self.dirty = True
 
     def handle_click(self, mouse_pos_relative: tuple[int, int]) -> tuple[str, str | pygame.Color] | None:
         """
@@ -165,28 +176,41 @@ class Controls:
                 if color_value:
                     return ("color", color_value)
                 else:
-                    print(f"Warning: Color '{clicked_name}' not found in config.AVAILABLE_COLORS")
+                    logger.warning("Color '%s' not found in config.AVAILABLE_COLORS", clicked_name)
 
         return None
 
-    def render(self, target_surface: pygame.Surface, current_tool: str, current_color: pygame.Color):
+    def render(self, target_surface: pygame.Surface, current_tool: str, current_color: pygame.Color) -> bool:
         """
         Render the control panel to target surface.
+
+        The panel is only redrawn when hover, tool or color changed since the
+        last render; otherwise the cached panel surface is blitted as is.
         
         Args:
             target_surface: Surface where panel will be rendered.
             current_tool: Currently selected tool identifier.
             current_color: Currently selected color.
+
+        Returns:
+            True if the panel was redrawn, False if the cached surface was reused.
         """
-        self._draw_background()
+        selection = (current_tool, tuple(current_color))
+        redrawn = self.dirty or selection != self._drawn_selection
+        if redrawn:
+            self._draw_background()
 
-        for btn in self.buttons:
-            btn.is_selected = (btn.identifier == current_tool)
-        for btn in self.color_buttons:
-            btn.is_selected = (btn.base_color == current_color)
+            for btn in self.buttons:
+                btn.is_selected = (btn.identifier == current_tool)
+            for btn in self.color_buttons:
+                btn.is_selected = (btn.base_color == current_color)
 
-        all_buttons = self.buttons + self.color_buttons
-        for button in all_buttons:
-            button.draw(self.surface)
+            all_buttons = self.buttons + self.color_buttons
+            for button in all_buttons:
+                button.draw(self.surface)
+
+            self._drawn_selection = selection
+            self.dirty = False
         
-        target_surface.blit(self.surface, self.rect.topleft)
\ No newline at end of file
+        target_surface.blit(self.surface, self.rect.topleft)
+        return redrawn
\ No newline at end of file
@@ -0,0 +1,388 @@
+"""
+Tests for the rasterization algorithms.
+
+Every rasterizer is compared against the straightforward integer loop it
+replaced, both through the Numba-compiled kernels and through the pure
+Python/NumPy fallbacks used when Numba is not installed.
+"""
+import itertools
+import math
+import random
+
+import numpy as np
+import pytest
+
+from graficador.algorithms import bezier, bresenham, dda, shapes
+from graficador.algorithms._kernels import (
+    bresenham_line_into,
+    bresenham_lines_into,
+    dda_line_into,
+    ellipse_into,
+)
+from graficador.geometry.point import Point
+
+Pixel = tuple[int, int]
+
+def _python(kernel):
+    """Return the uncompiled Python function behind a (possibly) Numba kernel."""
+    return getattr(kernel, "py_func", kernel)
+
+# Compiled kernel (or the plain function without Numba) and its Python source.
+KERNEL_VARIANTS = ["compiled", "python"]
+
+def _kernel(kernel, variant: str):
+    return kernel if variant == "compiled" else _python(kernel)
+
+@pytest.fixture(params=[True, False], ids=["numba", "fallback"])
+def numba_path(request, monkeypatch):
+    """Run a test once through the Numba path and once through the NumPy fallback."""
+    if request.param and not bresenham.NUMBA_AVAILABLE:
+        pytest.skip("Numba is not installed")
+    monkeypatch.setattr(bresenham, "NUMBA_AVAILABLE", request.param)
+    monkeypatch.setattr(dda, "NUMBA_AVAILABLE", request.param)
+    return request.param
+
+def reference_line(x1: int, y1: int, x2: int, y2: int) -> list[Pixel]:
+    """Classic Bresenham line loop, in drawing order."""
+    dx, dy = abs(x2 - x1), abs(y2 - y1)
+    sx = 1 if x1 < x2 else -1
+    sy = 1 if y1 < y2 else -1
+    err = dx - dy
+    x, y = x1, y1
+    pixels = []
+    while True:
+        pixels.append((x, y))
+        if x == x2 and y == y2:
+            return pixels
+        e2 = 2 * err
+        if e2 > -dy:
+            err -= dy
+            x += sx
+        if e2 < dx:
+            err += dx
+            y += sy
+
+def reference_dda(x1: int, y1: int, x2: int, y2: int) -> list[Pixel]:
+    """DDA line with position i computed as p1 + i * increment, rounded half to even."""
+    steps = max(abs(x2 - x1), abs(y2 - y1))
+    if steps == 0:
+        return [(x1, y1)]
+    x_inc, y_inc = (x2 - x1) / steps, (y2 - y1) / steps
+    return [(round(x1 + i * x_inc), round(y1 + i * y_inc)) for i in range(steps + 1)]
+
+def reference_circle(xc: int, yc: int, radius: int) -> set[Pixel]:
+    """Midpoint circle loop with eight-way symmetry."""
+    if radius == 0:
+        return {(xc, yc)}
+    pixels = set()
+    x, y, p = 0, radius, 1 - radius
+    while True:
+        for ox, oy in ((x, y), (y, x)):
+            pixels.update({(xc + ox, yc + oy), (xc - ox, yc + oy),
+                           (xc + ox, yc - oy), (xc - ox, yc - oy)})
+        if x >= y:
+            return pixels
+        x += 1
+        if p < 0:
+            p += 2 * x + 1
+        else:
+            y -= 1
+            p += 2 * (x - y) + 1
+
+def reference_ellipse(xc: int, yc: int, rx: int, ry: int) -> set[Pixel]:
+    """Midpoint ellipse loop with four-way symmetry, stopping at the x axis."""
+    rx_sq, ry_sq = rx * rx, ry * ry
+    pixels = set()
+
+    def plot(x: int, y: int) -> None:
+        pixels.update({(xc + x, yc + y), (xc - x, yc + y),
+                       (xc + x, yc - y), (xc - x, yc - y)})
+
+    x, y = 0, ry
+    p1 = ry_sq - rx_sq * ry + 0.25 * rx_sq
+    plot(x, y)
+    while ry_sq * x < rx_sq * y:
+        x += 1
+        if p1 < 0:
+            p1 += 2 * ry_sq * x + ry_sq
+        else:
+            y -= 1
+            p1 += 2 * ry_sq * x - 2 * rx_sq * y + ry_sq
+        plot(x, y)
+
+    p2 = ry_sq * (x + 0.5) ** 2 + rx_sq * (y - 1) ** 2 - rx_sq * ry_sq
+    while y > 0:
+        y -= 1
+        if p2 > 0:
+            p2 += -2 * rx_sq * y + rx_sq
+        else:
+            x += 1
+            p2 += 2 * ry_sq * x - 2 * rx_sq * y + rx_sq
+        plot(x, y)
+    return pixels
+
+def _pixels(xs: np.ndarray, ys: np.ndarray) -> list[Pixel]:
+    assert xs.dtype == np.int32 and ys.dtype == np.int32
+    return list(zip(xs.tolist(), ys.tolist()))
+
+# Endpoint offsets covering all eight octants, both axes, both diagonals and
+# the slopes on either side of them.
+LINE_OFFSETS = list(itertools.product(range(-9, 10), repeat=2)) + [
+    (200, 1), (1, 200), (-200, 3), (3, -200), (123, -77), (-77, -123), (500, 499),
+]
+
+def _random_lines(count: int, seed: int = 7) -> list[tuple[int, int, int, int]]:
+    rng = random.Random(seed)
+    return [tuple(rng.randint(-300, 300) for _ in range(4)) for _ in range(count)]
+
+@pytest.mark.parametrize("dx, dy", LINE_OFFSETS)
+def test_bresenham_line_pixels_matches_reference(numba_path, dx, dy):
+    p1 = Point(5, -3)
+    p2 = Point(p1.x + dx, p1.y + dy)
+    assert _pixels(*bresenham.bresenham_line_pixels(p1, p2)) == reference_line(*p1, *p2)
+
+def test_bresenham_line_pixels_zero_length(numba_path):
+    xs, ys = bresenham.bresenham_line_pixels(Point(4, 7), Point(4, 7))
+    assert _pixels(xs, ys) == [(4, 7)]
+
+@pytest.mark.parametrize("variant", KERNEL_VARIANTS)
+def test_bresenham_line_into_matches_reference(variant):
+    kernel = _kernel(bresenham_line_into, variant)
+    for x1, y1, x2, y2 in _random_lines(300) + [(3, 3, 3, 3)]:
+        size = max(abs(x2 - x1), abs(y2 - y1)) + 1
+        xs = np.empty(size, dtype=np.int32)
+        ys = np.empty(size, dtype=np.int32)
+        assert kernel(x1, y1, x2, y2, xs, ys) == size
+        assert _pixels(xs, ys) == reference_line(x1, y1, x2, y2)
+
+def _line_batch(lines: list[tuple[int, int, int, int]]) -> tuple[np.ndarray, ...]:
+    return tuple(np.array(column, dtype=np.int64) for column in zip(*lines))
+
+def _reference_batch(lines: list[tuple[int, int, int, int]]) -> list[Pixel]:
+    return [pixel for line in lines for pixel in reference_line(*line)]
+
+def test_bresenham_lines_closed_form_matches_reference():
+    lines = _random_lines(300) + [
+        (0, 0, 0, 0), (2, 2, 9, 2), (2, 2, 2, -9), (0, 0, -6, 6),
+    ]
+    x1s, y1s, x2s, y2s = _line_batch(lines)
+    sizes = np.maximum(np.abs(x2s - x1s), np.abs(y2s - y1s)) + 1
+    pixels = _pixels(*bresenham._bresenham_lines_closed_form(x1s, y1s, x2s, y2s, sizes))
+    assert pixels == _reference_batch(lines)
+
+@pytest.mark.parametrize("variant", KERNEL_VARIANTS)
+def test_bresenham_lines_into_matches_reference(variant):
+    lines = _random_lines(50, seed=11) + [(1, 1, 1, 1)]
+    x1s, y1s, x2s, y2s = _line_batch(lines)
+    sizes = np.maximum(np.abs(x2s - x1s), np.abs(y2s - y1s)) + 1
+    offsets = np.zeros(len(sizes) + 1, dtype=np.int64)
+    np.cumsum(sizes, out=offsets[1:])
+    xs = np.empty(offsets[-1], dtype=np.int32)
+    ys = np.empty(offsets[-1], dtype=np.int32)
+    _kernel(bresenham_lines_into, variant)(x1s, y1s, x2s, y2s, offsets, xs, ys)
+    assert _pixels(xs, ys) == _reference_batch(lines)
+
+def test_bresenham_lines_pixels_matches_reference(numba_path):
+    lines = _random_lines(100, seed=3) + [(0, 0, 0, 0), (-4, 8, 12, 8)]
+    pixels = _pixels(*bresenham.bresenham_lines_pixels(*_line_batch(lines)))
+    assert pixels == _reference_batch(lines)
+
+def test_bresenham_lines_pixels_empty_batch(numba_path):
+    xs, ys = bresenham.bresenham_lines_pixels(*(np.empty(0, dtype=np.int64),) * 4)
+    assert len(xs) == 0 and len(ys) == 0
+
+@pytest.mark.parametrize("dx, dy", [
+    (0, 0), (7, 0), (0, -7), (9, 2), (-2, 9), (30, -11), (-11, -30),
+])
+def test_bresenham_line_runs_cover_line_pixels(dx, dy):
+    p1 = Point(10, 20)
+    p2 = Point(p1.x + dx, p1.y + dy)
+    covered = set()
+    for x, y, width, height in bresenham.bresenham_line_runs(p1, p2).tolist():
+        covered.update(itertools.product(range(x, x + width), range(y, y + height)))
+    assert covered == set(reference_line(*p1, *p2))
+
+@pytest.mark.parametrize("dx, dy", LINE_OFFSETS)
+def test_dda_line_pixels_matches_reference(numba_path, dx, dy):
+    p1 = Point(-6, 4)
+    p2 = Point(p1.x + dx, p1.y + dy)
+    assert _pixels(*dda.dda_line_pixels(p1, p2)) == reference_dda(*p1, *p2)
+
+def test_dda_line_pixels_random_lines(numba_path):
+    for x1, y1, x2, y2 in _random_lines(300, seed=19):
+        pixels = _pixels(*dda.dda_line_pixels(Point(x1, y1), Point(x2, y2)))
+        assert pixels == reference_dda(x1, y1, x2, y2)
+
+@pytest.mark.parametrize("variant", KERNEL_VARIANTS)
+def test_dda_line_into_matches_reference(variant):
+    kernel = _kernel(dda_line_into, variant)
+    for x1, y1, x2, y2 in _random_lines(300, seed=23) + [(3, 3, 3, 3), (0, 0, 9, 9)]:
+        size = max(abs(x2 - x1), abs(y2 - y1)) + 1
+        xs = np.empty(size, dtype=np.int32)
+        ys = np.empty(size, dtype=np.int32)
+        assert kernel(x1, y1, x2, y2, xs, ys) == size
+        assert _pixels(xs, ys) == reference_dda(x1, y1, x2, y2)
+
+@pytest.mark.parametrize("radius", list(range(0, 40)) + [99, 100, 257, 1000])
+def test_bresenham_circle_pixels_matches_reference(radius):
+    center = Point(-4, 13)
+    pixels = _pixels(*bresenham.bresenham_circle_pixels(center, radius))
+    assert set(pixels) == reference_circle(center.x, center.y, radius)
+
+def test_bresenham_circle_pixels_negative_radius():
+    xs, ys = bresenham.bresenham_circle_pixels(Point(0, 0), -1)
+    assert len(xs) == 0 and len(ys) == 0
+
+def test_isqrt_is_exact_around_perfect_squares():
+    roots = np.arange(0, 3_000_000, 997, dtype=np.int64)
+    values = np.concatenate((roots * roots - 1, roots * roots, roots * roots + 1))
+    values = values[values >= 0]
+    expected = np.array([math.isqrt(value) for value in values.tolist()],
+                        dtype=np.int64)
+    assert np.array_equal(bresenham._isqrt(values), expected)
+
+ELLIPSE_RADII = [(1, 1), (1, 2), (2, 1), (1, 9), (9, 1), (3, 3), (5, 12), (12, 5),
+                 (40, 7), (7, 40), (113, 11), (250, 249)]
+
+@pytest.mark.parametrize("variant", KERNEL_VARIANTS)
+@pytest.mark.parametrize("rx, ry", ELLIPSE_RADII)
+def test_ellipse_into_matches_reference(variant, rx, ry):
+    size = 4 * (rx + ry + 1)
+    xs = np.empty(size, dtype=np.int32)
+    ys = np.empty(size, dtype=np.int32)
+    count = _kernel(ellipse_into, variant)(20, -5, rx, ry, xs, ys)
+    pixels = _pixels(xs[:count], ys[:count])
+    # Every pixel is written once: points on an axis are not duplicated.
+    assert len(pixels) == len(set(pixels))
+    assert set(pixels) == reference_ellipse(20, -5, rx, ry)
+
+@pytest.mark.parametrize("rx, ry", ELLIPSE_RADII)
+def test_midpoint_ellipse_pixels_matches_reference(rx, ry):
+    pixels = _pixels(*shapes.midpoint_ellipse_pixels(Point(0, 0), rx, ry))
+    assert set(pixels) == reference_ellipse(0, 0, rx, ry)
+
+def test_midpoint_ellipse_pixels_zero_radii_yield_center():
+    assert _pixels(*shapes.midpoint_ellipse_pixels(Point(6, 8), 0, 0)) == [(6, 8)]
+
+@pytest.mark.parametrize("rx, ry", [(0, 5), (5, 0), (-1, 3), (3, -1)])
+def test_midpoint_ellipse_pixels_degenerate_radii_are_empty(rx, ry):
+    xs, ys = shapes.midpoint_ellipse_pixels(Point(6, 8), rx, ry)
+    assert len(xs) == 0 and len(ys) == 0
+
+def de_casteljau(control: list[tuple[float, float]], t: float) -> tuple[float, float]:
+    """Evaluate a Bezier curve by repeated linear interpolation."""
+    points = list(control)
+    while len(points) > 1:
+        points = [((1 - t) * a[0] + t * b[0], (1 - t) * a[1] + t * b[1])
+                  for a, b in zip(points, points[1:])]
+    return points[0]
+
+# Curves that never pass through the same point twice at a vertex, so each
+# flattened vertex maps back to a single curve parameter.
+OPEN_BEZIER_CONTROLS = [
+    [(0, 0), (30, 120), (170, -60), (200, 90)],  # S curve
+    [(10, 10), (400, 10), (-200, 300), (250, 300)],  # wide bends
+    [(0, 0), (100, 100), (0, 100), (100, 0)],  # self-intersecting loop
+    [(0, 0), (10, 10), (20, 20), (30, 30)],  # straight line
+]
+BEZIER_CONTROLS = OPEN_BEZIER_CONTROLS + [
+    [(0, 0), (100, 0), (-100, 0), (0, 0)],  # collinear, closed
+    [(5, 5), (5, 5), (5, 5), (5, 5)],  # all control points equal
+]
+
+def _grid_curve(control: list[tuple[float, float]]) -> np.ndarray:
+    """Curve samples at every t = k / 2**MAX_SUBDIVISION_DEPTH."""
+    t = np.linspace(0.0, 1.0, 2 ** bezier.MAX_SUBDIVISION_DEPTH + 1)[:, None]
+    p0, p1, p2, p3 = (np.array(point, dtype=np.float64) for point in control)
+    mt = 1.0 - t
+    return mt ** 3 * p0 + 3 * mt * mt * t * p1 + 3 * mt * t * t * p2 + t ** 3 * p3
+
+def _on_curve(vertex: tuple[float, float], curve: np.ndarray) -> np.ndarray:
+    """Indices of the grid samples that coincide with a vertex."""
+    return np.flatnonzero(np.abs(curve - np.array(vertex)).max(axis=1) < 1e-9)
+
+def _grid_indices(vertices: list[tuple[float, float]], curve: np.ndarray) -> list[int]:
+    """Map each flattened vertex to the subdivision parameter it was split at."""
+    return [int(_on_curve(vertex, curve)[0]) for vertex in vertices]
+
+@pytest.mark.parametrize("control", BEZIER_CONTROLS)
+def test_flatten_endpoints_are_exact(control):
+    vertices = bezier._flatten(*control)
+    assert vertices[0] == control[0]
+    assert vertices[-1] == control[3]
+
+@pytest.mark.parametrize("control", BEZIER_CONTROLS)
+def test_flatten_vertices_lie_on_curve(control):
+    curve = _grid_curve(control)
+    for vertex in bezier._flatten(*control):
+        assert len(_on_curve(vertex, curve)), f"{vertex} is not on the curve"
+
+@pytest.mark.parametrize("control", OPEN_BEZIER_CONTROLS)
+def test_flatten_vertices_follow_curve_order(control):
+    curve = _grid_curve(control)
+    indices = _grid_indices(bezier._flatten(*control), curve)
+    assert indices[0] == 0 and indices[-1] == len(curve) - 1
+    assert all(a < b for a, b in zip(indices, indices[1:]))
+
+@pytest.mark.parametrize("tolerance", [0.25, 0.5, 2.0])
+@pytest.mark.parametrize("control", OPEN_BEZIER_CONTROLS)
+def test_flatten_respects_tolerance(control, tolerance):
+    vertices = bezier._flatten(*control, tolerance=tolerance)
+    curve = _grid_curve(control)
+    indices = _grid_indices(vertices, curve)
+    for start, end in zip(indices, indices[1:]):
+        # Compare each piece with its chord traversed at the same parameters.
+        s = np.linspace(0.0, 1.0, end - start + 1)[:, None]
+        chord = (1 - s) * curve[start] + s * curve[end]
+        assert np.abs(curve[start:end + 1] - chord).max() <= tolerance
+
+def test_flatten_uses_fewer_vertices_for_flatter_curves():
+    control = BEZIER_CONTROLS[1]
+    fine = bezier._flatten(*control, tolerance=0.25)
+    coarse = bezier._flatten(*control, tolerance=4.0)
+    assert len(fine) > len(coarse)
+    assert len(bezier._flatten((0, 0), (10, 10), (20, 20), (30, 30))) == 2
+    assert len(bezier._flatten((5, 5), (5, 5), (5, 5), (5, 5))) == 2
+
+@pytest.mark.parametrize("control", [
+    [(0.0, 0.0), (1e12, -1e12), (-1e12, 1e12), (1.0, 1.0)],  # never flat enough
+    [(0.0, 0.0), (float("nan"), 0.0), (3.0, 3.0), (4.0, 4.0)],  # deviation is NaN
+])
+def test_flatten_stops_at_max_subdivision_depth(monkeypatch, control):
+    monkeypatch.setattr(bezier, "MAX_SUBDIVISION_DEPTH", 6)
+    vertices = bezier._flatten(*control)
+    assert len(vertices) == 2 ** 6 + 1
+    assert vertices[0] == control[0] and vertices[-1] == control[3]
+
+@pytest.mark.parametrize("num_segments", [1, 2, 7, 50, 333])
+@pytest.mark.parametrize("control", BEZIER_CONTROLS)
+def test_cubic_bezier_polyline_fixed_segments_match_de_casteljau(control, num_segments):
+    points = [Point(*point) for point in control]
+    xs, ys = bezier.cubic_bezier_polyline(*points, num_segments=num_segments)
+
+    expected: list[Pixel] = []
+    for i in range(num_segments + 1):
+        x, y = de_casteljau(control, i / num_segments)
+        pixel = (round(x), round(y))
+        if not expected or expected[-1] != pixel:
+            expected.append(pixel)
+    assert _pixels(xs, ys) == expected
+
+@pytest.mark.parametrize("control", BEZIER_CONTROLS)
+def test_cubic_bezier_polyline_adaptive_default(control):
+    points = [Point(*point) for point in control]
+    xs, ys = bezier.cubic_bezier_polyline(*points)
+    pixels = _pixels(xs, ys)
+    assert pixels[0] == control[0] and pixels[-1] == control[3]
+    assert all(a != b for a, b in zip(pixels, pixels[1:]))
+
+def test_bezier_basis_is_cached_and_read_only():
+    basis = bezier._bezier_basis(20)
+    assert bezier._bezier_basis(20) is basis
+    assert not basis.flags.writeable
+    assert basis.shape == (21, 4)
+    assert np.allclose(basis.sum(axis=1), 1.0)
+    for i, row in enumerate(basis.tolist()):
+        t = i / 20
+        expected = [(1 - t) ** 3, 3 * (1 - t) ** 2 * t, 3 * (1 - t) * t * t, t ** 3]
+        assert row == pytest.approx(expected, abs=1e-15)
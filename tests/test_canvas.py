@@ -0,0 +1,97 @@
+"""
+Tests for the canvas drawing primitives.
+"""
+import random
+
+import numpy as np
+import pygame
+import pytest
+
+from graficador.algorithms.bresenham import bresenham_line_pixels
+from graficador.algorithms.shapes import rectangle_outline_rects
+from graficador.geometry.point import Point
+from graficador.ui.canvas import Canvas
+
+WIDTH, HEIGHT = 40, 30
+BACKGROUND = pygame.Color("white")
+INK = pygame.Color("black")
+
+@pytest.fixture
+def canvas():
+    canvas = Canvas(10, 20, WIDTH, HEIGHT, BACKGROUND)
+    canvas.take_dirty_rects()
+    return canvas
+
+def _painted(canvas: Canvas) -> np.ndarray:
+    """Boolean (width, height) mask of the pixels that differ from the background."""
+    return pygame.surfarray.array2d(canvas.surface) != canvas.map_color(BACKGROUND)
+
+def _expected(*rects) -> np.ndarray:
+    mask = np.zeros((WIDTH, HEIGHT), dtype=bool)
+    for x, y, width, height in rects:
+        mask[max(x, 0):max(x + width, 0), max(y, 0):max(y + height, 0)] = True
+    return mask
+
+@pytest.mark.parametrize("rect", [
+    (-3, 5, 10, 1),  # runs off the left edge
+    (5, -4, 1, 10),  # runs off the top edge
+    (-5, -5, 8, 8),  # overlaps the top-left corner
+    (35, 25, 20, 20),  # overlaps the bottom-right corner
+])
+def test_fill_rects_crops_rects_to_canvas(canvas, rect):
+    canvas.fill_rects(np.array([rect], dtype=np.int32), INK)
+    assert np.array_equal(_painted(canvas), _expected(rect))
+
+def test_fill_rects_skips_rects_outside_canvas(canvas):
+    rects = np.array([(-10, 5, 10, 1), (5, HEIGHT, 3, 3), (-4, -4, 2, 2)],
+                     dtype=np.int32)
+    canvas.fill_rects(rects, INK)
+    assert not _painted(canvas).any()
+    assert canvas.take_dirty_rects() == []
+
+def test_fill_rects_marks_cropped_region_dirty(canvas):
+    rects = np.array([(-3, 5, 10, 1), (30, 25, 20, 2)], dtype=np.int32)
+    canvas.fill_rects(rects, INK)
+    dirty = canvas.take_dirty_rects()
+    assert dirty == [pygame.Rect(10, 25, WIDTH, 22)]
+
+def _rectangle_corners(count: int, seed: int = 5):
+    """Random corner pairs, many off the canvas, plus degenerate rectangles."""
+    rng = random.Random(seed)
+    corners = []
+    for _ in range(count):
+        margin = rng.choice((0, 3, 60))
+        x0, x1 = (rng.randint(-margin, WIDTH - 1 + margin) for _ in range(2))
+        y0, y1 = (rng.randint(-margin, HEIGHT - 1 + margin) for _ in range(2))
+        corners.append((Point(x0, y0), Point(x1, y1)))
+    corners += [
+        (Point(5, 5), Point(5, 5)),  # single pixel
+        (Point(3, 7), Point(20, 7)),  # horizontal line
+        (Point(8, -10), Point(8, 50)),  # vertical line through the canvas
+        (Point(-5, -5), Point(WIDTH + 4, HEIGHT + 4)),  # encloses the canvas
+        (Point(-10, 10), Point(-1, 20)),  # entirely left of the canvas
+        # Only parts of two edges visible; pygame.draw.rect gets these wrong.
+        (Point(-7, 1), Point(66, -14)),
+        (Point(58, 55), Point(38, 27)),
+    ]
+    return corners
+
+@pytest.mark.parametrize("p1, p2", _rectangle_corners(300))
+def test_rectangle_outline_matches_bresenham_edges(canvas, p1, p2):
+    canvas.fill_rects(rectangle_outline_rects(p1, p2), INK)
+
+    expected = np.zeros((WIDTH, HEIGHT), dtype=bool)
+    corners = [p1, Point(p2.x, p1.y), p2, Point(p1.x, p2.y)]
+    for a, b in zip(corners, corners[1:] + corners[:1]):
+        xs, ys = bresenham_line_pixels(a, b)
+        inside = (xs >= 0) & (xs < WIDTH) & (ys >= 0) & (ys < HEIGHT)
+        expected[xs[inside], ys[inside]] = True
+    painted = _painted(canvas)
+    assert np.array_equal(painted, expected)
+
+    # The reported dirty region covers every painted pixel.
+    covered = np.zeros((WIDTH, HEIGHT), dtype=bool)
+    for rect in canvas.take_dirty_rects():
+        rect = rect.move(-canvas.rect.x, -canvas.rect.y)
+        covered[rect.left:rect.right, rect.top:rect.bottom] = True
+    assert not (painted & ~covered).any()
@@ -0,0 +1,81 @@
+"""
+Tests for the geometry helpers: point buffers and viewport tests.
+"""
+import numpy as np
+import pytest
+
+from graficador.geometry.clipping import box_outside
+from graficador.geometry.point import Point
+from graficador.geometry.point_buffer import PointBuffer
+
+WIDTH, HEIGHT = 100, 50
+
+def test_point_buffer_starts_empty():
+    buffer = PointBuffer()
+    assert len(buffer) == 0
+    assert buffer.array.shape == (0, 2)
+    assert list(buffer) == []
+
+def test_point_buffer_append_and_index():
+    buffer = PointBuffer()
+    buffer.append(Point(1, 2))
+    buffer.append(Point(-3, 4))
+    assert len(buffer) == 2
+    assert buffer[0] == Point(1, 2)
+    assert buffer[1] == Point(-3, 4)
+    assert buffer[-1] == Point(-3, 4)
+    assert isinstance(buffer[0].x, int)
+
+@pytest.mark.parametrize("index", [2, -3])
+def test_point_buffer_index_out_of_range(index):
+    buffer = PointBuffer()
+    buffer.append(Point(1, 2))
+    buffer.append(Point(3, 4))
+    with pytest.raises(IndexError):
+        buffer[index]
+
+def test_point_buffer_grows_past_capacity():
+    buffer = PointBuffer(capacity=2)
+    points = [Point(i, 10 * i) for i in range(7)]
+    for point in points:
+        buffer.append(point)
+    assert len(buffer) == 7
+    assert list(buffer) == points
+    assert buffer.array.tolist() == [list(point) for point in points]
+
+def test_point_buffer_array_is_int32_view():
+    buffer = PointBuffer()
+    buffer.append(Point(5, 6))
+    buffer.append(Point(7, 8))
+    array = buffer.array
+    assert array.dtype == np.int32
+    assert array.shape == (2, 2)
+    assert array.flags.c_contiguous
+    array[0, 0] = 42
+    assert buffer[0] == Point(42, 6)
+
+def test_point_buffer_clear_reuses_storage():
+    buffer = PointBuffer(capacity=4)
+    for i in range(3):
+        buffer.append(Point(i, i))
+    storage = buffer.array.base
+    buffer.clear()
+    assert len(buffer) == 0
+    assert list(buffer) == []
+    buffer.append(Point(9, 9))
+    assert list(buffer) == [Point(9, 9)]
+    assert buffer.array.base is storage
+
+@pytest.mark.parametrize("box, outside", [
+    ((10, 10, 20, 20), False),
+    ((-10, -10, 200, 200), False),  # covers the viewport
+    ((-10, -10, 0, 0), False),  # touches the top-left pixel
+    ((WIDTH - 1, HEIGHT - 1, WIDTH + 5, HEIGHT + 5), False),  # bottom-right pixel
+    ((-10, 10, -1, 20), True),  # left
+    ((WIDTH, 10, WIDTH + 10, 20), True),  # right
+    ((10, -10, 20, -1), True),  # above
+    ((10, HEIGHT, 20, HEIGHT + 10), True),  # below
+    ((-10, -10, -1, -1), True),  # beyond a corner
+])
+def test_box_outside(box, outside):
+    assert box_outside(*box, WIDTH, HEIGHT) is outside